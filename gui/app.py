@@ -10,7 +10,6 @@ import tkinter as tk
 from tkinter import ttk, font as tkfont
 import threading
 
-from solver import solve_linear_equation
 from gui.sidebar import Sidebar
 
 # ── Theme data (palettes, mutable colour shortcuts) ────────────────────────
@@ -837,6 +836,9 @@ class DualSolverApp(
         gen = self._solve_gen
         def _solve():
             try:
+                # Imported here so SymPy/NumPy load off the UI thread on
+                # first use instead of delaying the window's first paint.
+                from solver import solve_linear_equation
                 result = solve_linear_equation(equation, mode=mode,
                                                values_str=values_str,
                                                compute_mode=compute_mode)
@@ -9,6 +9,7 @@ import json
 import os
 import time
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 
 _DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
@@ -23,11 +24,38 @@ DEFAULT_SETTINGS = {
 }
 
 
+# In-memory database while a batched_writes() block is open, else None.
+_pending_db = None
+
+
 def _ensure_dir() -> None:
     os.makedirs(_DATA_DIR, exist_ok=True)
 
 
+@contextmanager
+def batched_writes():
+    """Coalesce storage writes: load the file once, save it once on exit.
+
+    Inside the block every read and write goes to one in-memory copy, so
+    e.g. a run of :func:`add_history` calls costs a single JSON round-trip.
+    Nested blocks join the outermost one.  Getters hand out copies of
+    the pending records, so callers cannot edit the batch by accident.
+    """
+    global _pending_db
+    if _pending_db is not None:
+        yield
+        return
+    _pending_db = _load_db()
+    try:
+        yield
+    finally:
+        db, _pending_db = _pending_db, None
+        _save_db(db)
+
+
 def _load_db() -> dict:
+    if _pending_db is not None:
+        return _pending_db
     _ensure_dir()
     if os.path.exists(_DATA_FILE):
         try:
@@ -46,6 +74,10 @@ def _load_db() -> dict:
 
 
 def _save_db(db: dict) -> None:
+    global _pending_db
+    if _pending_db is not None:
+        _pending_db = db
+        return
     _ensure_dir()
     with open(_DATA_FILE, "w", encoding="utf-8") as f:
         json.dump(db, f, indent=2, ensure_ascii=False)
@@ -64,7 +96,7 @@ def get_settings() -> dict:
 def save_settings(settings: dict) -> None:
     """Persist settings."""
     db = _load_db()
-    db["settings"] = settings
+    db["settings"] = dict(settings)  # a batch must not alias the caller's dict
     _save_db(db)
 
 
@@ -90,19 +122,26 @@ def add_history(equation: str, answer: str) -> str:
     return record_id
 
 
+def _detached(records: list[dict]) -> list[dict]:
+    """Copy *records* while a batch is open, so they don't alias it."""
+    if _pending_db is None:
+        return records
+    return [dict(r) for r in records]
+
+
 def get_history(include_archived: bool = False) -> list[dict]:
     """Return history list (newest first). Excludes archived by default."""
     db = _load_db()
     history = db.get("history", [])
     if not include_archived:
         history = [r for r in history if not r.get("archived", False)]
-    return history
+    return _detached(history)
 
 
 def get_archived_history() -> list[dict]:
     """Return only archived history entries."""
     db = _load_db()
-    return [r for r in db.get("history", []) if r.get("archived", False)]
+    return _detached([r for r in db.get("history", []) if r.get("archived", False)])
 
 
 def delete_history_item(record_id: str) -> None:
@@ -57,7 +57,8 @@ from solver.substitution import solve_substitution as _solve_substitution
 
 def solve_linear_equation(equation_str: str, *, mode: str = "symbolic",
                           values_str: str = "",
-                          compute_mode: str = "symbolic") -> dict:
+                          compute_mode: str = "symbolic",
+                          detailed: bool = True) -> dict:
     """Solve a linear equation either symbolically or numerically,
     or verify it via substitution.
 
@@ -74,13 +75,16 @@ def solve_linear_equation(equation_str: str, *, mode: str = "symbolic",
     compute_mode : str, optional
         For substitution mode: ``"symbolic"`` (exact) or
         ``"numerical"`` (decimal).
+    detailed : bool, optional
+        Symbolic mode only: ``False`` skips the 2×2 substitution
+        walkthrough when only the answer is needed.
     """
     if mode == "substitution":
         result = _solve_substitution(equation_str, values_str, compute_mode)
     elif mode == "numerical":
         result = _solve_numeric(equation_str)
     else:
-        result = _solve_symbolic(equation_str)
+        result = _solve_symbolic(equation_str, detailed=detailed)
 
     # Inject computation type into the "given" section so the solution
     # trail shows which mode was used.
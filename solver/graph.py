@@ -8,13 +8,20 @@ Handles three equation types:
   - system     : two equations, two unknowns (e.g. "x+y=10, x-y=2")
 """
 
+import functools
 import re
+import string
 import numpy as np
-from sympy import symbols, sympify, solve as sym_solve, lambdify, Eq
+from sympy import (
+    solve as sym_solve, lambdify, expand as sym_expand,
+    simplify as sym_simplify, Add, S,
+)
 from sympy.parsing.sympy_parser import (
     parse_expr, standard_transformations, implicit_multiplication_application,
 )
 
+from solver.symbolic import _sym
+
 TRANSFORMATIONS = standard_transformations + (implicit_multiplication_application,)
 
 # ── palette ────────────────────────────────────────────────────────────────
@@ -54,6 +61,17 @@ C_HLINE    = _DARK_GRAPH["C_HLINE"]
 C_DOT      = _DARK_GRAPH["C_DOT"]
 C_TEXT     = _DARK_GRAPH["C_TEXT"]
 
+# ── patterns used on every analyse / build pass ────────────────────────────
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+_FRAC_RE   = re.compile(r'⟦([^|⟧]+)\|([^⟧]+)⟧')
+_SPLIT_RE  = re.compile(r"[,;]")
+_SOL_RE    = re.compile(r"=\s*(-?[\d./]+)")
+_ASSIGN_RE = re.compile(
+    r"^\s*(\w+)\s*=\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*$", re.M)
+_PI_RE     = re.compile(r'(?<![a-zA-Z])pi(?![a-zA-Z])')
+_NO_SOLUTION_RE = re.compile(r"Cannot|(?i:no solution)")
+_INFINITE_RE    = re.compile(r"(?i:infinite|every|all real)")
+
 
 def set_theme(theme: str) -> None:
     """Update the graph colour palette to match the app theme ('dark' or 'light')."""
@@ -157,10 +175,28 @@ def restyle_figure(fig, theme: str) -> None:
                 pass
 
 
+@functools.lru_cache(maxsize=256)
+def _var_list(variables: str) -> tuple:
+    """Split a trail ``"x, y"`` variables string into stripped names."""
+    return tuple(v.strip() for v in variables.split(","))
+
+
 def _parse_eq(eq_str):
-    """Return (lhs_expr, rhs_expr) as SymPy expressions."""
+    """Return (lhs_expr, rhs_expr, local) with SymPy expressions."""
+    lhs, rhs, local_items = _parse_eq_cached(eq_str.strip())
+    return lhs, rhs, dict(local_items)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_eq_cached(eq_str):
+    """Cached worker for :func:`_parse_eq`.
+
+    Analysis and figure building parse the same equation strings again on
+    every refresh; the symbol table comes back as a tuple so the cached
+    entry cannot be mutated by a caller.
+    """
     # Strip any display-only fraction markers (⟦num|den⟧ → (num)/den)
-    eq_str = re.sub(r'⟦([^|⟧]+)\|([^⟧]+)⟧', r'(\1)/\2', eq_str)
+    eq_str = _FRAC_RE.sub(r'(\1)/\2', eq_str)
     # Strip middle-dot used instead of * for display
     eq_str = eq_str.replace('·', '*')
     sides = eq_str.split("=")
@@ -169,11 +205,77 @@ def _parse_eq(eq_str):
     lhs_s = sides[0].strip().replace("^", "**")
     rhs_s = sides[1].strip().replace("^", "**")
     # Collect all single-letter variable names
-    letters = sorted(set(re.findall(r"[a-zA-Z]", lhs_s + rhs_s)))
-    local = {c: symbols(c) for c in letters}
+    letters = sorted(set(lhs_s + rhs_s) & _ASCII_LETTERS)
+    local = {c: _sym(c) for c in letters}
     lhs = parse_expr(lhs_s, local_dict=local, transformations=TRANSFORMATIONS)
     rhs = parse_expr(rhs_s, local_dict=local, transformations=TRANSFORMATIONS)
-    return lhs, rhs, local
+    return lhs, rhs, tuple(local.items())
+
+
+@functools.lru_cache(maxsize=256)
+def _numpy_fn(sym, expr):
+    """Vectorised NumPy callable for *expr* as a function of *sym*.
+
+    Polynomials — the linear case in practice — are evaluated with
+    ``np.polyval`` on their float coefficients, which needs no code
+    generation; anything else goes through ``lambdify``.
+    """
+    poly = expr.as_poly(sym)
+    if poly is not None:
+        try:
+            coeffs = [float(c) for c in poly.all_coeffs()]
+        except TypeError:
+            pass
+        else:
+            return lambda v: np.polyval(coeffs, v)
+    return lambdify(sym, expr, modules="numpy")
+
+
+def _line_coeffs(expr, xsym, ysym):
+    """Return ``(a, b, c)`` for expanded *expr* read as ``a·x + b·y - c``.
+
+    One pass over the terms of the common linear form; any other term
+    shape falls back to ``coeff`` / ``subs``, which handle everything.
+    """
+    a = b = c = S.Zero
+    for term in Add.make_args(expr):
+        k, m = term.as_independent(xsym, ysym, as_Add=False)
+        if m == xsym:
+            a += k
+        elif m == ysym:
+            b += k
+        elif m is S.One:
+            c -= k
+        else:
+            return (expr.coeff(xsym), expr.coeff(ysym),
+                    -expr.subs([(xsym, 0), (ysym, 0)]))
+    return a, b, c
+
+
+def _solve_for(expr, sym):
+    """``sym_solve(expr, sym)`` with a direct path for *expr* linear in *sym*.
+
+    ``b·sym + rest = 0`` gives ``sym = -rest/b`` without SymPy's solver
+    dispatch; anything else is handed to ``sym_solve``.
+    """
+    b = expr.coeff(sym)
+    rest = expr - b * sym
+    if b != 0 and not b.has(sym) and not rest.has(sym):
+        return [-rest / b]
+    return sym_solve(expr, sym)
+
+
+def _grid_size(sym, *exprs) -> int:
+    """Number of sample points for plotting *exprs* against *sym*.
+
+    Straight lines look the same with half the points; anything curved
+    (1/x, powers, functions) keeps the full 400.
+    """
+    for expr in exprs:
+        poly = expr.as_poly(sym)
+        if poly is None or poly.degree() > 1:
+            return 400
+    return 200
 
 
 def _style_axes(ax, fig):
@@ -233,30 +335,47 @@ def analyze_result(result: dict) -> dict | None:
     inputs["raw_equation"] = result.get("equation", "")
     final  = result.get("final_answer", "")
 
-    if "equations" in inputs:
-        out = _analyze_system(inputs, final)
-    elif "variable" in inputs and "variables" not in inputs:
-        out = _analyze_single_var(inputs, final)
-    elif "variables" in inputs:
-        var_list = [v.strip() for v in inputs["variables"].split(",")]
-        if len(var_list) == 2:
-            out = _analyze_two_var(inputs, final)
-        else:
-            out = None
-    else:
-        out = None
+    try:
+        out = _analyze_cached(tuple(sorted(inputs.items())), final)
+    except TypeError:       # unhashable input value — analyse uncached
+        out = _analyze(inputs, final)
+    return dict(out) if out is not None else None
+
+
+@functools.lru_cache(maxsize=64)
+def _analyze_cached(items: tuple, final: str) -> dict | None:
+    """Memoised :func:`_analyze`; the GUI panel and PDF export share it."""
+    return _analyze(dict(items), final)
+
+
+def _analyze(inputs: dict, final: str) -> dict | None:
+    analyze = _ANALYZERS.get(_input_kind(inputs))
+    out = analyze(inputs, final) if analyze is not None else None
 
     if out is not None:
         _prettify_analysis(out)
     return out
 
 
+def _input_kind(inputs: dict) -> str | None:
+    """Classify trail *inputs* as "system", "single_var", "two_var",
+    "multi_var", or None when nothing applies."""
+    if "equations" in inputs:
+        return "system"
+    if "variables" in inputs:
+        n_vars = len(_var_list(inputs["variables"]))
+        return "two_var" if n_vars == 2 else "multi_var"
+    if "variable" in inputs:
+        return "single_var"
+    return None
+
+
 def _prettify_analysis(d: dict) -> None:
     """Apply Unicode symbol clean-up to all user-visible text in *d*."""
     for key in ("form", "description", "detail", "solution", "case_label"):
         v = d.get(key)
         if isinstance(v, str):
-            v = re.sub(r'(?<![a-zA-Z])pi(?![a-zA-Z])', 'π', v)
+            v = _PI_RE.sub('π', v)
             v = v.replace('sqrt(', '√(')
             v = v.replace('sqrt ⟦', '√⟦')
             v = v.replace('sqrt⟦', '√⟦')
@@ -269,7 +388,7 @@ def _analyze_single_var(inputs, final) -> dict:
     v        = var_name
 
     # Detect anomalies from final answer text
-    if "Cannot solve" in final or "no solution" in final.lower():
+    if _NO_SOLUTION_RE.search(final):
         return {
             "eq_type":    "single_var",
             "case":       "no_solution",
@@ -284,7 +403,7 @@ def _analyze_single_var(inputs, final) -> dict:
             "solution": "No solution",
             "graphable": True,
         }
-    if "infinite" in final.lower() or "every" in final.lower() or "all real" in final.lower():
+    if _INFINITE_RE.search(final):
         return {
             "eq_type":    "single_var",
             "case":       "infinite",
@@ -323,20 +442,17 @@ def _analyze_single_var(inputs, final) -> dict:
 
 def _analyze_two_var(inputs, final) -> dict:
     eq_str   = inputs.get("raw_equation") or inputs.get("equation", "?")
-    var_list = [v.strip() for v in inputs.get("variables", "x, y").split(",")]
+    var_list = _var_list(inputs.get("variables", "x, y"))
     xn       = var_list[0] if len(var_list) > 0 else "x"
     yn       = var_list[1] if len(var_list) > 1 else "y"
 
     try:
         lhs, rhs, local = _parse_eq(eq_str)
-        from sympy import expand as sym_expand
         expr = sym_expand(lhs - rhs)
         # Degenerate: all coefficients zero
-        xsym = local.get(xn, symbols(xn))
-        ysym = local.get(yn, symbols(yn))
-        a = expr.coeff(xsym)
-        b = expr.coeff(ysym)
-        c = -expr.subs([(xsym, 0), (ysym, 0)])
+        xsym = local.get(xn, _sym(xn))
+        ysym = local.get(yn, _sym(yn))
+        a, b, c = _line_coeffs(expr, xsym, ysym)
         a_zero = (a == 0)
         b_zero = (b == 0)
         c_zero = (c == 0)
@@ -394,23 +510,22 @@ def _analyze_two_var(inputs, final) -> dict:
 
 def _analyze_system(inputs, final) -> dict:
     eqs_str  = inputs.get("equations", "")
-    var_list = [v.strip() for v in inputs.get("variables", "x, y").split(",")]
+    var_list = _var_list(inputs.get("variables", "x, y"))
     xn       = var_list[0] if len(var_list) > 0 else "x"
     yn       = var_list[1] if len(var_list) > 1 else "y"
 
-    eq_parts = re.split(r"[,;]", eqs_str)
+    eq_parts = _SPLIT_RE.split(eqs_str)
     if len(eq_parts) < 2:
         return None
 
     try:
-        from sympy import Rational, Matrix
         lhs1, rhs1, loc1 = _parse_eq(eq_parts[0].strip())
         lhs2, rhs2, loc2 = _parse_eq(eq_parts[1].strip())
-        xsym = symbols(xn); ysym = symbols(yn)
+        xsym = _sym(xn); ysym = _sym(yn)
         e1 = (lhs1 - rhs1).expand()
         e2 = (lhs2 - rhs2).expand()
-        a1 = e1.coeff(xsym); b1 = e1.coeff(ysym); c1 = -e1.subs([(xsym,0),(ysym,0)])
-        a2 = e2.coeff(xsym); b2 = e2.coeff(ysym); c2 = -e2.subs([(xsym,0),(ysym,0)])
+        a1, b1, c1 = _line_coeffs(e1, xsym, ysym)
+        a2, b2, c2 = _line_coeffs(e2, xsym, ysym)
 
         # Build augmented matrix determinant-style checks
         det = a1*b2 - a2*b1
@@ -427,9 +542,9 @@ def _analyze_system(inputs, final) -> dict:
             case = "infinite" if same else "no_solution"
     except Exception:
         # Fallback: infer from final answer text
-        if "no solution" in final.lower() or "Cannot" in final:
+        if _NO_SOLUTION_RE.search(final):
             case = "no_solution"
-        elif "infinite" in final.lower():
+        elif _INFINITE_RE.search(final):
             case = "infinite"
         else:
             case = "one_solution"
@@ -502,19 +617,8 @@ def build_figure(result: dict):
 
     # ── Detect case ────────────────────────────────────────────────────
     try:
-        if "equations" in inputs:
-            fig = _build_system(inputs, final)
-        elif "variable" in inputs and "variables" not in inputs:
-            fig = _build_single_var(inputs, final)
-        elif "variables" in inputs:
-            var_list = [v.strip() for v in inputs["variables"].split(",")]
-            if len(var_list) == 2:
-                fig = _build_two_var(inputs, final)
-            else:
-                # >2 variables — project onto first two
-                fig = _build_multi_var_projection(inputs, final)
-        else:
-            fig = None
+        build = _BUILDERS.get(_input_kind(inputs))
+        fig = build(inputs, final) if build is not None else None
     except Exception:
         fig = None
 
@@ -542,13 +646,13 @@ def _build_single_var(inputs, final):
 
     try:
         lhs, rhs, local = _parse_eq(eq_str)
-        x = local.get(var_name, symbols(var_name))
+        x = local.get(var_name, _sym(var_name))
     except Exception:
         return _text_figure(f"Equation: {eq_str}", "Could not parse equation for graphing")
 
     # Determine solution value
     sol_val = None
-    match = re.search(r"=\s*(-?[\d./]+)", final)
+    match = _SOL_RE.search(final)
     if match:
         try:
             sol_val = float(match.group(1))
@@ -557,28 +661,28 @@ def _build_single_var(inputs, final):
 
     # Anomaly detection
     anomaly = None
-    if "Cannot solve" in final or "no solution" in final.lower():
+    if _NO_SOLUTION_RE.search(final):
         anomaly = "no_solution"
-    elif "infinite" in final.lower() or "every" in final.lower():
+    elif _INFINITE_RE.search(final):
         anomaly = "infinite"
 
     # X range — centre around solution
     cx = sol_val if sol_val is not None else 0.0
-    x_range = np.linspace(cx - 5, cx + 5, 400)
+    x_range = np.linspace(cx - 5, cx + 5, _grid_size(x, lhs, rhs))
 
     try:
-        f_lhs = lambdify(x, lhs, modules="numpy")
-        f_rhs = lambdify(x, rhs, modules="numpy")
+        f_lhs = _numpy_fn(x, lhs)
+        f_rhs = _numpy_fn(x, rhs)
         _lhs_raw = f_lhs(x_range)
         if np.ndim(_lhs_raw) == 0:
-            y_lhs = np.full_like(x_range, float(_lhs_raw), dtype=float)
+            y_lhs = np.broadcast_to(float(_lhs_raw), x_range.shape)
         else:
-            y_lhs = np.array(_lhs_raw, dtype=float)
+            y_lhs = np.asarray(_lhs_raw, dtype=float)
         _rhs_raw = f_rhs(x_range)
         if np.ndim(_rhs_raw) == 0:
-            y_rhs = np.full_like(x_range, float(_rhs_raw), dtype=float)
+            y_rhs = np.broadcast_to(float(_rhs_raw), x_range.shape)
         else:
-            y_rhs = np.array(_rhs_raw, dtype=float)
+            y_rhs = np.asarray(_rhs_raw, dtype=float)
     except Exception:
         return _text_figure(f"Equation: {eq_str}", "Could not evaluate equation for graphing")
 
@@ -617,28 +721,27 @@ def _build_two_var(inputs, final):
     from matplotlib.figure import Figure
 
     eq_str   = inputs.get("raw_equation") or inputs.get("equation", "")
-    var_list = [v.strip() for v in inputs.get("variables", "x, y").split(",")]
+    var_list = _var_list(inputs.get("variables", "x, y"))
     if len(var_list) < 2:
         return _text_figure(f"Equation: {eq_str}", "Need at least 2 variables to plot")
     xn, yn = var_list[0], var_list[1]
 
     try:
         lhs, rhs, local = _parse_eq(eq_str)
-        xsym = local.get(xn, symbols(xn))
-        ysym = local.get(yn, symbols(yn))
+        xsym = local.get(xn, _sym(xn))
+        ysym = local.get(yn, _sym(yn))
     except Exception:
         return _text_figure(f"Equation: {eq_str}", "Could not parse equation for graphing")
 
-    x_range = np.linspace(-8, 8, 400)
-
     # Solve for y in terms of x
     try:
         expr = lhs - rhs
-        y_sols = sym_solve(expr, ysym)
+        y_sols = _solve_for(expr, ysym)
         if y_sols:
             y_expr = y_sols[0]
-            f_y = lambdify(xsym, y_expr, modules="numpy")
-            y_vals = np.array(f_y(x_range), dtype=float)
+            x_range = np.linspace(-8, 8, _grid_size(xsym, y_expr))
+            f_y = _numpy_fn(xsym, y_expr)
+            y_vals = np.asarray(f_y(x_range), dtype=float)
             plot_as_y_of_x = True
         else:
             plot_as_y_of_x = False
@@ -649,7 +752,7 @@ def _build_two_var(inputs, final):
     if not plot_as_y_of_x:
         try:
             expr = lhs - rhs
-            x_sols = sym_solve(expr, xsym)
+            x_sols = _solve_for(expr, xsym)
             if x_sols:
                 x_const = float(x_sols[0])
                 fig = Figure(figsize=(7, 3.4), dpi=100)
@@ -688,7 +791,7 @@ def _build_two_var(inputs, final):
 
 def _build_multi_var_projection(inputs, final):
     """For equations with 3+ variables, project onto the first two and plot."""
-    var_list = [v.strip() for v in inputs.get("variables", "").split(",")]
+    var_list = _var_list(inputs.get("variables", ""))
     if len(var_list) < 2:
         return _text_figure("3+ Variable Equation",
                             "Too many variables to display in 2D.\nShowing first two variables.")
@@ -716,7 +819,7 @@ def _build_single_var_system(inputs, final, var_name):
     from matplotlib.figure import Figure
 
     eqs_str  = inputs.get("equations", "")
-    eq_parts = re.split(r"[,;]", eqs_str)
+    eq_parts = _SPLIT_RE.split(eqs_str)
     if len(eq_parts) < 1:
         return _text_figure("System", "No equations found")
 
@@ -724,12 +827,14 @@ def _build_single_var_system(inputs, final, var_name):
 
     # Collect all lambdified (fn, label, color) triples
     funcs = []
+    plotted = []
     try:
-        x_sym = symbols(var_name)
+        x_sym = _sym(var_name)
         for i, eq_s in enumerate(eq_parts[:4]):
             lhs, rhs, local = _parse_eq(eq_s.strip())
-            f_lhs = lambdify(x_sym, lhs, modules="numpy")
-            f_rhs = lambdify(x_sym, rhs, modules="numpy")
+            plotted += [lhs, rhs]
+            f_lhs = _numpy_fn(x_sym, lhs)
+            f_rhs = _numpy_fn(x_sym, rhs)
             c = colors[i % len(colors)]
             funcs.append((f_lhs, f"LHS eq{i+1}: {eq_s.strip()}", c, "solid"))
             funcs.append((f_rhs, f"RHS eq{i+1}: {eq_s.strip()}", c, "dotted"))
@@ -743,23 +848,22 @@ def _build_single_var_system(inputs, final, var_name):
     # since the final_answer string may just say "x = 0" for dependent 1-var systems.
     anomaly = None
     title = "Solution"
-    if "no solution" in final.lower():
+    if _NO_SOLUTION_RE.search(final):
         anomaly = "no_solution"
         title = "No Solution — Parallel lines (never intersect)"
-    elif "infinite" in final.lower():
+    elif _INFINITE_RE.search(final):
         anomaly = "infinite"
         title = "Infinite Solutions — Equations are equivalent"
     else:
         # Inspect coefficients: if all equations reduce to the same ratio → dependent
         try:
-            xsym2 = symbols(var_name)
+            xsym2 = _sym(var_name)
             exprs = []
             for eq_s in eq_parts[:4]:
                 lh, rh, _ = _parse_eq(eq_s.strip())
                 exprs.append((lh - rh).expand())
             if len(exprs) >= 2:
                 # Check if all are scalar multiples of exprs[0]
-                from sympy import simplify as sym_simplify, S as S_
                 ratios = []
                 for e in exprs[1:]:
                     r = sym_simplify(e / exprs[0]) if exprs[0] != 0 else None
@@ -771,7 +875,7 @@ def _build_single_var_system(inputs, final, var_name):
             pass
         if anomaly is None:
             # Extract solution value for marker if possible
-            m = re.search(r"=\s*(-?[\d./]+)", final)
+            m = _SOL_RE.search(final)
             sol_val = None
             if m:
                 try:
@@ -782,7 +886,7 @@ def _build_single_var_system(inputs, final, var_name):
 
     # Extract sol_val at top level for centering / dot marker
     sol_val = None
-    m = re.search(r"=\s*(-?[\d./]+)", final)
+    m = _SOL_RE.search(final)
     if m:
         try:
             sol_val = float(m.group(1))
@@ -790,7 +894,7 @@ def _build_single_var_system(inputs, final, var_name):
             pass
 
     cx = sol_val if sol_val is not None else 0.0
-    x_range = np.linspace(cx - 5, cx + 5, 400)
+    x_range = np.linspace(cx - 5, cx + 5, _grid_size(x_sym, *plotted))
 
     fig = Figure(figsize=(7, 3.4), dpi=100)
     ax  = fig.add_subplot(111)
@@ -799,8 +903,8 @@ def _build_single_var_system(inputs, final, var_name):
     for fn, lbl, col, ls in funcs:
         try:
             raw = fn(x_range)
-            y = np.full_like(x_range, float(raw), dtype=float) if np.ndim(raw) == 0 \
-                else np.array(raw, dtype=float)
+            y = np.broadcast_to(float(raw), x_range.shape) if np.ndim(raw) == 0 \
+                else np.asarray(raw, dtype=float)
             ax.plot(x_range, y, color=col, linewidth=2,
                     linestyle=ls, label=lbl)
         except Exception:
@@ -831,7 +935,7 @@ def _build_system(inputs, final):
     from matplotlib.figure import Figure
 
     eqs_str  = inputs.get("equations", "")
-    var_list = [v.strip() for v in inputs.get("variables", "x, y").split(",")]
+    var_list = _var_list(inputs.get("variables", "x, y"))
 
     # ── 1-variable system: plot LHS vs RHS for each equation ──────────
     if len(var_list) < 2:
@@ -840,7 +944,7 @@ def _build_system(inputs, final):
     xn, yn = var_list[0], var_list[1]
 
     # Split on comma or semicolon
-    eq_parts = re.split(r"[,;]", eqs_str)
+    eq_parts = _SPLIT_RE.split(eqs_str)
     if len(eq_parts) < 2:
         return _text_figure("System", "Could not find two equations")
     eq1_str, eq2_str = eq_parts[0].strip(), eq_parts[1].strip()
@@ -848,18 +952,18 @@ def _build_system(inputs, final):
     def _line_fn(eq_s):
         try:
             lhs, rhs, local = _parse_eq(eq_s)
-            xsym = local.get(xn, symbols(xn))
-            ysym = local.get(yn, symbols(yn))
+            xsym = local.get(xn, _sym(xn))
+            ysym = local.get(yn, _sym(yn))
             expr = lhs - rhs
-            y_sols = sym_solve(expr, ysym)
+            y_sols = _solve_for(expr, ysym)
             if not y_sols:
                 return None, None
-            return lambdify(xsym, y_sols[0], modules="numpy"), str(y_sols[0])
+            return _numpy_fn(xsym, y_sols[0]), y_sols[0]
         except Exception:
             return None, None
 
-    f1, expr1 = _line_fn(eq1_str)
-    f2, expr2 = _line_fn(eq2_str)
+    f1, y_expr1 = _line_fn(eq1_str)
+    f2, y_expr2 = _line_fn(eq2_str)
     if f1 is None or f2 is None:
         return _text_figure(
             "System",
@@ -868,27 +972,17 @@ def _build_system(inputs, final):
         )
 
     # Parse solution coordinates
-    sol_x = sol_y = None
-    for line in final.split("\n"):
-        if "=" in line:
-            vname, _, vval = line.partition("=")
-            vname = vname.strip(); vval = vval.strip()
-            try:
-                v = float(vval)
-                if vname == xn:
-                    sol_x = v
-                elif vname == yn:
-                    sol_y = v
-            except ValueError:
-                pass
+    vals = {m.group(1): float(m.group(2)) for m in _ASSIGN_RE.finditer(final)}
+    sol_x, sol_y = vals.get(xn), vals.get(yn)
 
     # Determine x range
     cx = sol_x if sol_x is not None else 0.0
-    x_range = np.linspace(cx - 8, cx + 8, 400)
+    x_range = np.linspace(cx - 8, cx + 8,
+                          _grid_size(_sym(xn), y_expr1, y_expr2))
 
     try:
-        y1 = np.array(f1(x_range), dtype=float)
-        y2 = np.array(f2(x_range), dtype=float)
+        y1 = np.asarray(f1(x_range), dtype=float)
+        y2 = np.asarray(f2(x_range), dtype=float)
     except Exception:
         return None
 
@@ -903,7 +997,7 @@ def _build_system(inputs, final):
     diff = np.abs(y1 - y2)
     if np.allclose(y1, y2, atol=1e-6):
         title = "Infinite solutions — same line (equations are equivalent)"
-    elif np.all(diff > 1e-6):
+    elif diff.min() > 1e-6:
         # Check if lines never cross in range → parallel
         slope1 = (y1[-1] - y1[0]) / (x_range[-1] - x_range[0])
         slope2 = (y2[-1] - y2[0]) / (x_range[-1] - x_range[0])
@@ -928,7 +1022,7 @@ def _build_system(inputs, final):
     y_all = np.concatenate([y1, y2])
     y_finite = y_all[np.isfinite(y_all)]
     if len(y_finite):
-        ylo, yhi = np.percentile(y_finite, 2), np.percentile(y_finite, 98)
+        ylo, yhi = np.percentile(y_finite, [2, 98])
         pad = max((yhi - ylo) * 0.2, 1.0)
         ax.set_ylim(ylo - pad, yhi + pad)
 
@@ -936,3 +1030,19 @@ def _build_system(inputs, final):
                     labelcolor=C_TEXT)
     fig.tight_layout(pad=1.2)
     return fig
+
+
+# ── Dispatch by input kind (see _input_kind) ────────────────────────────────
+
+_ANALYZERS = {
+    "system":     _analyze_system,
+    "single_var": _analyze_single_var,
+    "two_var":    _analyze_two_var,
+}
+_BUILDERS = {
+    "system":     _build_system,
+    "single_var": _build_single_var,
+    "two_var":    _build_two_var,
+    # >2 variables — project onto first two
+    "multi_var":  _build_multi_var_projection,
+}
@@ -7,13 +7,10 @@ multi-variable (e.g. "2x + 4y = 1"), or systems of equations
 returning decimal approximations via NumPy.
 """
 
-import re
 import time
-from datetime import datetime
 
 import numpy as np
-import sympy
-from sympy import symbols, sympify, Eq, solve, simplify, expand, Symbol, fraction
+from sympy import sympify, Eq, S, solve, simplify, expand, Symbol, fraction
 from sympy.parsing.sympy_parser import (
     parse_expr, standard_transformations, implicit_multiplication_application,
     convert_xor, rationalize,
@@ -36,6 +33,9 @@ from solver.symbolic import (
     _normalize_spacing,
     _format_expr,
     _format_expr_plain,
+    _highest_degree,
+    _single_var_degree,
+    _now_str,
     _format_input_str,
     _format_input_eq,
     _format_equation,
@@ -48,11 +48,29 @@ from solver.symbolic import (
     _nonlinear_error_result,
     _count_terms_in_str,
     _validate_characters,
+    _sym,
+    _isolate_rational_linear,
+    _UNICODE_INPUT,
+    _SYSTEM_SPLIT_RE,
 )
 
+# "library" field of every numerical summary.
+_NUMPY_LIB = f"NumPy {np.__version__}"
+
 
 # ── Numeric formatting helpers ──────────────────────────────────────────
 
+def _to_float(value) -> float:
+    """``float(value)``, dividing ``p / q`` directly for SymPy rationals.
+
+    Python's int division is correctly rounded, so the result matches
+    ``float(Rational)`` without going through SymPy's number dispatch.
+    """
+    if getattr(value, "is_Rational", False):
+        return value.p / value.q
+    return float(value)
+
+
 def _fmt_num(value: float, max_decimals: int = 10) -> str:
     """Format a float into a clean decimal string.
 
@@ -94,16 +112,13 @@ def solve_numeric(equation_str: str) -> dict:
     t_start = time.perf_counter()
 
     # ── Normalise Unicode symbols ────────────────────────────────────
-    equation_str = equation_str.replace('\u221a', 'sqrt')
-    equation_str = equation_str.replace('\u03c0', '(pi)')
-    equation_str = equation_str.replace('[', '(').replace(']', ')')
-    equation_str = equation_str.replace('{', '(').replace('}', ')')
+    equation_str = equation_str.translate(_UNICODE_INPUT)
 
     # ── Validate input characters ────────────────────────────────────
     _validate_characters(equation_str)
 
     # ── Split by , or ; to detect a system ───────────────────────────
-    raw_equations = [eq.strip() for eq in re.split(r'\s*[;,]\s*', equation_str)
+    raw_equations = [eq.strip() for eq in _SYSTEM_SPLIT_RE.split(equation_str)
                      if eq.strip()]
     all_text = ' '.join(raw_equations)
     var_names = _detect_variables(all_text)
@@ -126,7 +141,7 @@ def solve_numeric(equation_str: str) -> dict:
         raise ValueError("Both sides of the equation must have expressions.")
 
     var_name = var_names[0]
-    var = symbols(var_name)
+    var = _sym(var_name)
 
     lhs = _parse_side(lhs_str, var)
     rhs = _parse_side(rhs_str, var)
@@ -134,7 +149,7 @@ def solve_numeric(equation_str: str) -> dict:
     # ── Linearity / non-linear check (same logic as symbolic) ────────
     combined = lhs - rhs
     combined_expanded = expand(combined)
-    poly_degree = combined_expanded.as_poly(var)
+    poly_degree = _single_var_degree(combined_expanded, var)
 
     if poly_degree is None:
         if var not in combined_expanded.free_symbols:
@@ -151,17 +166,19 @@ def solve_numeric(equation_str: str) -> dict:
             )
         else:
             raise ValueError("Could not determine the degree. Please check the equation.")
-    elif poly_degree.degree() > 1:
+    elif poly_degree > 1:
         return _nonlinear_error_result(
             equation_str, lhs_str, rhs_str, lhs, rhs,
-            [var_name], poly_degree.degree(), t_start,
+            [var_name], poly_degree, t_start,
         )
-    elif poly_degree.degree() == 0:
+    elif poly_degree == 0:
         pass  # degenerate
 
     # ── Solve symbolically first, then convert to numeric ────────────
-    coeff = combined_expanded.coeff(var)
-    const = expand(combined_expanded - coeff * var)
+    # One pass over the expanded terms: {var: a, 1: b} for a·var + b
+    terms = combined_expanded.as_coefficients_dict(var)
+    coeff = terms.get(var, S.Zero)
+    const = terms.get(S.One, S.Zero)
 
     steps = []
     _fmt_input_lhs = _format_input_str(lhs_str)
@@ -194,9 +211,10 @@ def solve_numeric(equation_str: str) -> dict:
 
     # Handle degenerate (coefficient == 0)
     if coeff == 0:
-        rhs_val = simplify(expand(lhs - rhs + coeff * var))
-        # Actually recalculate: rhs_val = const = lhs - rhs with 0*var
-        is_zero = simplify(const) == 0
+        # const is already expanded; simplify only if SymPy cannot decide
+        is_zero = const.is_zero
+        if is_zero is None:
+            is_zero = simplify(const) == 0
         if is_zero:
             steps.append({
                 "description": "The variable cancels — identity",
@@ -235,8 +253,8 @@ def solve_numeric(equation_str: str) -> dict:
 
     # ── Numerical solve via NumPy ────────────────────────────────────
     # ax + b = 0 where a = coeff, b = const
-    a_val = float(coeff)
-    b_val = float(const)  # const = lhs - rhs sans the var term
+    a_val = _to_float(coeff)
+    b_val = _to_float(const)  # const = lhs - rhs sans the var term
 
     steps.append({
         "description": "Identify the coefficient and constant",
@@ -291,7 +309,7 @@ def _solve_multi_var_numeric(equation_str: str, var_names: list,
     Expresses each variable in terms of the others, converting all
     coefficients to decimal form.
     """
-    var_symbols = [symbols(v) for v in var_names]
+    var_symbols = [_sym(v) for v in var_names]
 
     if '=' not in equation_str:
         raise ValueError("Equation must contain '='. Example: 2x + 4y = 1")
@@ -307,21 +325,11 @@ def _solve_multi_var_numeric(equation_str: str, var_names: list,
 
     _fmt_mv_lhs = _format_expr(lhs)
     _fmt_mv_rhs = _format_expr(rhs)
-    _fmt_mv_eq = _format_equation(lhs, rhs)
+    _fmt_mv_eq = f"{_fmt_mv_lhs} = {_fmt_mv_rhs}"
 
     # Verify linearity
     combined = expand(lhs - rhs)
-    max_degree = 0
-    for vs in var_symbols:
-        p = combined.as_poly(vs)
-        if p is not None and p.degree() > max_degree:
-            max_degree = p.degree()
-    try:
-        total_poly = combined.as_poly(*var_symbols)
-        if total_poly is not None and total_poly.total_degree() > max_degree:
-            max_degree = total_poly.total_degree()
-    except Exception:
-        pass
+    max_degree = _highest_degree(combined, var_symbols)
     if _has_transcendental(combined, var_symbols):
         return _nonlinear_error_result(
             equation_str, lhs_str, rhs_str, lhs, rhs,
@@ -363,16 +371,14 @@ def _solve_multi_var_numeric(equation_str: str, var_names: list,
     eq = Eq(lhs, rhs)
     solutions = {}
     for vn, vs in zip(var_names, var_symbols):
-        sol = solve(eq, vs)
+        sol = _isolate_rational_linear(combined, var_symbols, vs)
+        if sol is None:
+            sol = solve(eq, vs)
         if sol:
             sol_expr = sol[0]
             solutions[vn] = sol_expr
             others = [v for v in var_names if v != vn]
-            # Convert all numeric coefficients to decimal
-            numeric_parts = []
-            for term in sympy.Add.make_args(sol_expr):
-                numeric_parts.append(_format_expr_plain(term))
-            numeric_str = " + ".join(numeric_parts) if len(numeric_parts) > 1 else numeric_parts[0]
+            numeric_str = _format_expr_plain(sol_expr)
             # Try to cast the whole expression to a float if fully numeric
             try:
                 val = float(sol_expr)
@@ -460,8 +466,8 @@ def _solve_multi_var_numeric(equation_str: str, var_names: list,
             "total_steps": len(steps),
             "verification_steps": len(verification_steps),
             "validation_status": "pass",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "library": f"NumPy {np.__version__}",
+            "timestamp": _now_str(),
+            "library": _NUMPY_LIB,
             "python": None,
         },
     }
@@ -472,7 +478,7 @@ def _solve_multi_var_numeric(equation_str: str, var_names: list,
 def _solve_system_numeric(raw_equations: list, var_names: list,
                           original_input: str, t_start: float) -> dict:
     """Solve a system of linear equations numerically using NumPy."""
-    var_symbols = [symbols(v) for v in var_names]
+    var_symbols = [_sym(v) for v in var_names]
     n_eq = len(raw_equations)
     n_var = len(var_names)
 
@@ -489,20 +495,12 @@ def _solve_system_numeric(raw_equations: list, var_names: list,
         r = _parse_side(parts[1].strip(), var_symbols)
         eq_objects.append(Eq(expand(l), expand(r)))
 
-    # Verify linearity
+    # Verify linearity (the expanded forms are reused to build A and b)
+    combined_exprs = []
     for i, eq_obj in enumerate(eq_objects):
         combined = expand(eq_obj.lhs - eq_obj.rhs)
-        max_deg = 0
-        for vs in var_symbols:
-            p = combined.as_poly(vs)
-            if p is not None and p.degree() > max_deg:
-                max_deg = p.degree()
-        try:
-            total_poly = combined.as_poly(*var_symbols)
-            if total_poly is not None and total_poly.total_degree() > max_deg:
-                max_deg = total_poly.total_degree()
-        except Exception:
-            pass
+        combined_exprs.append(combined)
+        max_deg = _highest_degree(combined, var_symbols)
         eq_str_i = raw_equations[i]
         eq_parts_i = eq_str_i.split('=')
         _nl_lhs_s = eq_parts_i[0].strip() if len(eq_parts_i) == 2 else eq_str_i
@@ -545,18 +543,14 @@ def _solve_system_numeric(raw_equations: list, var_names: list,
     # ── Build coefficient matrix A and constant vector b ─────────────
     # Each equation: sum_j(a_ij * x_j) = b_i
     try:
-        A = np.zeros((n_eq, n_var), dtype=np.float64)
-        b = np.zeros(n_eq, dtype=np.float64)
-
-        for i, eq_obj in enumerate(eq_objects):
-            expr = expand(eq_obj.lhs - eq_obj.rhs)
-            for j, vs in enumerate(var_symbols):
-                A[i, j] = float(expr.coeff(vs))
-            # constant = -(the remaining part after removing variable terms)
-            remaining = expr
-            for j, vs in enumerate(var_symbols):
-                remaining = remaining - A[i, j] * vs
-            b[i] = -float(remaining)
+        A_rows, b_vals = [], []
+        for expr in combined_exprs:
+            # One pass over the terms: {x_j: a_ij, 1: -b_i}
+            terms = expr.as_coefficients_dict(*var_symbols)
+            A_rows.append([_to_float(terms[vs]) for vs in var_symbols])
+            b_vals.append(-_to_float(terms[1]))
+        A = np.array(A_rows, dtype=np.float64)
+        b = np.array(b_vals, dtype=np.float64)
 
         steps.append({
             "description": "Build coefficient matrix and constant vector",
@@ -622,8 +616,8 @@ def _solve_system_numeric(raw_equations: list, var_names: list,
                             "total_steps": len(steps),
                             "verification_steps": 0,
                             "validation_status": "pass",
-                            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                            "library": f"NumPy {np.__version__}",
+                            "timestamp": _now_str(),
+                            "library": _NUMPY_LIB,
                             "python": None,
                         },
                     }
@@ -674,20 +668,21 @@ def _solve_system_numeric(raw_equations: list, var_names: list,
             "expression": "Checking…",
             "explanation": "Plug the numerical solution back into each original equation.",
         })
+        sub_dict = {vs: float(x[j]) for j, vs in enumerate(var_symbols)}
         for i, (eq_str, eq_obj) in enumerate(zip(raw_equations, eq_objects)):
-            sub_dict = {vs: float(x[j]) for j, vs in enumerate(var_symbols)}
-            lhs_val = float(eq_obj.lhs.subs(sub_dict))
-            rhs_val = float(eq_obj.rhs.subs(sub_dict))
+            lhs_val = float(eq_obj.lhs.xreplace(sub_dict))
+            rhs_val = float(eq_obj.rhs.xreplace(sub_dict))
             ok = abs(lhs_val - rhs_val) < 1e-10
+            lhs_fmt = _fmt_num(lhs_val)
             verification_steps.append({
                 "description": f"Equation ({i + 1}): {eq_str}",
                 "expression": (
-                    f"LHS = {_fmt_num(lhs_val)},  "
+                    f"LHS = {lhs_fmt},  "
                     f"RHS = {_fmt_num(rhs_val)}"
                     f"  →  {'✓' if ok else '✗'}"
                 ),
                 "explanation": (
-                    f"Both sides ≈ {_fmt_num(lhs_val)}."
+                    f"Both sides ≈ {lhs_fmt}."
                     if ok else "Sides differ — check the input."
                 ),
             })
@@ -739,8 +734,8 @@ def _solve_system_numeric(raw_equations: list, var_names: list,
                 "total_steps": len(steps),
                 "verification_steps": len(verification_steps),
                 "validation_status": "pass",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "library": f"NumPy {np.__version__}",
+                "timestamp": _now_str(),
+                "library": _NUMPY_LIB,
                 "python": None,
             },
         }
@@ -775,12 +770,14 @@ def _build_verification_numeric(lhs_str, rhs_str, var_name, var,
     })
 
     # Evaluate both sides
-    lhs_val = float(lhs_expr.subs(var, float(solution_val)))
-    rhs_val = float(rhs_expr.subs(var, float(solution_val)))
+    sub_dict = {var: float(solution_val)}
+    lhs_val = float(lhs_expr.xreplace(sub_dict))
+    rhs_val = float(rhs_expr.xreplace(sub_dict))
+    lhs_fmt, rhs_fmt = _fmt_num(lhs_val), _fmt_num(rhs_val)
 
     verification_steps.append({
         "description": f"Substitute {var_name} = {sol_str}",
-        "expression": f"LHS = {_fmt_num(lhs_val)},  RHS = {_fmt_num(rhs_val)}",
+        "expression": f"LHS = {lhs_fmt},  RHS = {rhs_fmt}",
         "explanation": (
             f"Replace {var_name} with {sol_str} and compute each side."
         ),
@@ -790,14 +787,14 @@ def _build_verification_numeric(lhs_str, rhs_str, var_name, var,
     verification_steps.append({
         "description": "Compare both sides",
         "expression": (
-            f"LHS = {_fmt_num(lhs_val)}, RHS = {_fmt_num(rhs_val)}\n"
+            f"LHS = {lhs_fmt}, RHS = {rhs_fmt}\n"
             f"LHS {'=' if ok else '≈'} RHS  {'✓' if ok else '✗'}"
         ),
         "explanation": (
-            f"Both sides equal {_fmt_num(lhs_val)}, confirming that "
+            f"Both sides equal {lhs_fmt}, confirming that "
             f"{var_name} = {sol_str} is correct!"
             if ok else
-            f"LHS ≈ {_fmt_num(lhs_val)}, RHS ≈ {_fmt_num(rhs_val)} — "
+            f"LHS ≈ {lhs_fmt}, RHS ≈ {rhs_fmt} — "
             f"close enough within floating-point precision."
         ),
     })
@@ -843,8 +840,8 @@ def _build_result(equation_str, fmt_eq, fmt_lhs, fmt_rhs,
             "total_steps": len(steps),
             "verification_steps": len(verification_steps),
             "validation_status": "pass",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "library": f"NumPy {np.__version__}",
+            "timestamp": _now_str(),
+            "library": _NUMPY_LIB,
             "python": None,
         },
     }
@@ -6,12 +6,12 @@ checks whether the equation holds true — producing step-by-step
 explanations along the way.
 """
 
+import functools
 import re
 import time
-from datetime import datetime
+from fractions import Fraction
 
-import sympy
-from sympy import symbols, sympify, simplify, expand, Symbol, Eq
+from sympy import sympify, simplify, expand, Symbol, Eq, Rational
 from sympy.parsing.sympy_parser import (
     parse_expr, standard_transformations, implicit_multiplication_application,
     convert_xor, rationalize,
@@ -30,6 +30,12 @@ from solver.symbolic import (
     _prettify_symbols,
     _normalize_spacing,
     _validate_characters,
+    _sym,
+    _UNICODE_INPUT,
+    _SYSTEM_SPLIT_RE,
+    _substitute_display_all,
+    _now_str,
+    _SYMPY_LIB,
     _FRAC_OPEN,
     _frac,
 )
@@ -59,7 +65,7 @@ def _parse_values(values_str: str) -> dict[str, str]:
 
     Returns a dict mapping variable names to their raw value strings.
     """
-    assignments = re.split(r'\s*[,;]\s*', values_str.strip())
+    assignments = _SYSTEM_SPLIT_RE.split(values_str.strip())
     result = {}
     for assignment in assignments:
         assignment = assignment.strip()
@@ -90,6 +96,45 @@ def _parse_values(values_str: str) -> dict[str, str]:
     return result
 
 
+def _simplify_value(expr):
+    """``simplify(expr)``, skipped when *expr* is already a plain number."""
+    if expr.is_Rational or expr.is_Float:
+        return expr
+    return simplify(expr)
+
+
+def _resolve_values(subs_dict: dict) -> dict:
+    """Resolve values that reference other given variables (x = y, y = 1).
+
+    Replaces repeatedly until no value mentions a substituted variable, so
+    the result is independent of dict order.  Raises ``ValueError`` for a
+    cycle or a self-reference (x = y, y = x; x = x + 1).
+    """
+    resolved = dict(subs_dict)
+    keys = set(resolved)
+    for _ in range(len(resolved) + 1):
+        if not any(val.free_symbols & keys for val in resolved.values()):
+            return resolved
+        resolved = {sym: val.xreplace(resolved) for sym, val in resolved.items()}
+    raise ValueError(
+        "The given values refer to each other in a cycle. "
+        "Please give each variable a value that does not depend on itself."
+    )
+
+
+# Plain numbers — "3", "-7/3", "0.25", ".5" — that need no parser.
+_PLAIN_NUMBER_RE = re.compile(r"[+-]?(?:0|[1-9]\d*)(?:/[1-9]\d*|\.\d*)?|[+-]?\.\d+")
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_value(val_str: str):
+    """Parse one user-supplied value (``3``, ``1/2``, ``pi``); memoised."""
+    if _PLAIN_NUMBER_RE.fullmatch(val_str):
+        frac = Fraction(val_str)
+        return Rational(frac.numerator, frac.denominator)
+    return parse_expr(val_str.replace('^', '**'), transformations=TRANSFORMATIONS)
+
+
 def solve_substitution(equation_str: str, values_str: str,
                        compute_mode: str = "symbolic") -> dict:
     """Substitute user-given values into an equation and verify.
@@ -113,10 +158,7 @@ def solve_substitution(equation_str: str, values_str: str,
     t_start = time.perf_counter()
 
     # ── Normalise Unicode ────────────────────────────────────────────
-    equation_str = equation_str.replace('\u221a', 'sqrt')
-    equation_str = equation_str.replace('\u03c0', '(pi)')
-    equation_str = equation_str.replace('[', '(').replace(']', ')')
-    equation_str = equation_str.replace('{', '(').replace('}', ')')
+    equation_str = equation_str.translate(_UNICODE_INPUT)
 
     values_str = values_str.replace('\u03c0', '(pi)')
 
@@ -151,7 +193,7 @@ def solve_substitution(equation_str: str, values_str: str,
         raise ValueError("Both sides of the equation must have expressions.")
 
     # ── Create symbols and parse values ──────────────────────────────
-    var_symbols = {name: symbols(name) for name in eq_vars}
+    var_symbols = {name: _sym(name) for name in eq_vars}
     sym_list = list(var_symbols.values())
 
     # Parse each side
@@ -165,10 +207,8 @@ def solve_substitution(equation_str: str, values_str: str,
     # Parse the user-supplied numeric/symbolic values
     parsed_values = {}
     for var_name, val_str in user_values.items():
-        val_str_clean = val_str.replace('^', '**')
         try:
-            parsed_val = parse_expr(val_str_clean, transformations=TRANSFORMATIONS)
-            parsed_values[var_name] = parsed_val
+            parsed_values[var_name] = _parse_value(val_str)
         except Exception as e:
             raise ValueError(
                 f"Could not parse value for {var_name}: '{val_str}'. Error: {e}"
@@ -211,12 +251,14 @@ def solve_substitution(equation_str: str, values_str: str,
     })
 
     # Step 3: Show substitution
-    lhs_sub_display = _format_expr(lhs_expr)
-    rhs_sub_display = _format_expr(rhs_expr)
-    for var_name, val in parsed_values.items():
-        val_str_display = _format_expr_plain(val)
-        lhs_sub_display = lhs_sub_display.replace(var_name, f'({val_str_display})')
-        rhs_sub_display = rhs_sub_display.replace(var_name, f'({val_str_display})')
+    # Display and evaluation share one resolved mapping, so x = y, y = 1
+    # shows (1) for x whichever order the values were given in.
+    subs_dict = _resolve_values(
+        {var_symbols[name]: val for name, val in parsed_values.items()})
+    display_values = {name: _format_expr_plain(subs_dict[var_symbols[name]])
+                      for name in parsed_values}
+    lhs_sub_display = _substitute_display_all(_format_expr(lhs_expr), display_values)
+    rhs_sub_display = _substitute_display_all(_format_expr(rhs_expr), display_values)
 
     steps.append({
         "description": f"Substitute {values_display} into the equation",
@@ -227,9 +269,8 @@ def solve_substitution(equation_str: str, values_str: str,
     })
 
     # Step 4: Evaluate the equation
-    subs_dict = {var_symbols[name]: val for name, val in parsed_values.items()}
-    lhs_result = simplify(lhs_expr.subs(subs_dict))
-    rhs_result = simplify(rhs_expr.subs(subs_dict))
+    lhs_result = _simplify_value(lhs_expr.xreplace(subs_dict))
+    rhs_result = _simplify_value(rhs_expr.xreplace(subs_dict))
 
     # Convert to decimal if numerical mode
     if compute_mode == "numerical":
@@ -258,7 +299,7 @@ def solve_substitution(equation_str: str, values_str: str,
     })
 
     # Step 5: Move RHS to the left to get the total value of the equation
-    equation_value = simplify(lhs_result - rhs_result)
+    equation_value = _simplify_value(lhs_result - rhs_result)
     if compute_mode == "numerical":
         equation_value = equation_value.evalf()
     eq_val_str = _format_expr(equation_value)
@@ -332,10 +373,10 @@ def solve_substitution(equation_str: str, values_str: str,
         "runtime_ms": runtime_ms,
         "total_steps": len(steps),
         "validation_status": validation_status,
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "timestamp": _now_str(),
         "library": (f"NumPy {__import__('numpy').__version__}"
                     if compute_mode == "numerical"
-                    else f"SymPy {sympy.__version__}"),
+                    else _SYMPY_LIB),
         "python": None,
     }
 
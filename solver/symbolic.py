@@ -7,14 +7,14 @@ multi-variable (e.g. "2x + 4y = 1"), or systems of equations
 step-by-step explanations.
 """
 
+import functools
 import re
 import time
-from datetime import datetime
 
 import sympy
 from sympy import (
-    symbols, sympify, Eq, solve, simplify, expand,
-    Add, Mul, Rational, S, Symbol, fraction
+    symbols, sympify, Eq, solve, linsolve, simplify, expand,
+    Add, Mul, Integer, Rational, S, Symbol, fraction
 )
 from sympy.parsing.sympy_parser import (
     parse_expr, standard_transformations, implicit_multiplication_application,
@@ -30,6 +30,29 @@ TRANSFORMATIONS = standard_transformations + (
 # Letters that DualSolver will recognise as the unknown variable.
 _ALLOWED_VARS = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
 
+# Summary timestamps have one-second resolution, so the formatted string is
+# cached per wall-clock second: [second, text].
+_TS_CACHE = [None, ""]
+
+# "library" field of every symbolic summary.
+_SYMPY_LIB = f"SymPy {sympy.__version__}"
+
+
+@functools.lru_cache(maxsize=256)
+def _sym(name):
+    """``symbols(name)`` for a single variable name, memoised."""
+    return symbols(name)
+
+
+def _now_str() -> str:
+    """Return the current local time as ``YYYY-MM-DD HH:MM:SS``."""
+    now = time.time()
+    sec = int(now)
+    if sec != _TS_CACHE[0]:
+        _TS_CACHE[0] = sec
+        _TS_CACHE[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+    return _TS_CACHE[1]
+
 
 def _detect_variables(equation_str: str) -> list:
     """Return a sorted list of single-letter variables found in *equation_str*.
@@ -66,10 +89,14 @@ def _expand_implicit_vars(s: str, var_names: set) -> str:
     """Replace multi-letter tokens composed entirely of known variable letters
     with explicit multiplication (e.g. ``as`` → ``a*s``) so that Python
     reserved words like ``as``, ``in``, ``for`` never reach the parser."""
+    # Deleting every variable letter leaves an empty string exactly when
+    # the token is made of variables only — one C-level pass per token.
+    drop_vars = str.maketrans('', '', ''.join(var_names))
+
     def _repl(m):
         tok = m.group(0)
         # Only expand if every letter belongs to a known variable
-        if all(ch in var_names for ch in tok):
+        if not tok.translate(drop_vars):
             return '*'.join(tok)
         return tok
     return re.sub(r'[A-Za-z]+', _repl, s)
@@ -79,13 +106,56 @@ def _parse_side(expr_str: str, var_symbols):
     """Parse one side of the equation into a SymPy expression.
 
     *var_symbols* may be a single ``Symbol`` or a list of ``Symbol`` objects.
+    Results are memoised on the raw string and the variable names, so the
+    same side seen again (re-solves, other compute modes) skips the parser.
     """
-    s = expr_str.strip()
-    s = s.replace('^', '**')
     if isinstance(var_symbols, Symbol):
-        local = {var_symbols.name: var_symbols}
+        var_key = (var_symbols.name,)
     else:
-        local = {sym.name: sym for sym in var_symbols}
+        var_key = tuple(sym.name for sym in var_symbols)
+    return _parse_side_cached(expr_str, var_key)
+
+
+# "3x + 2", "-x", "2*y - 7", "12": built directly, without parse_expr.
+# e/E and j/J are left to the parser — Python reads "3e+2" and "3j" as
+# number literals.
+_SIMPLE_SIDE_RE = re.compile(
+    r"([+-]?)\s*(?:(0|[1-9]\d*)\s*\*?\s*)?([A-DF-IK-Za-df-ik-z])"
+    r"\s*(?:([+-])\s*(0|[1-9]\d*))?"
+    r"|([+-]?)\s*(0|[1-9]\d*)"
+)
+
+
+def _parse_simple_side(s: str, var_key: tuple):
+    """Return the expression for a side of the form ``a·v + b``, else None."""
+    m = _SIMPLE_SIDE_RE.fullmatch(s)
+    if m is None:
+        return None
+    if m.group(7) is not None:
+        value = Integer(m.group(7))
+        return -value if m.group(6) == '-' else value
+    name = m.group(3)
+    if name not in var_key:
+        return None
+    coeff = Integer(m.group(2) or 1)
+    if m.group(1) == '-':
+        coeff = -coeff
+    const = Integer(m.group(5) or 0)
+    if m.group(4) == '-':
+        const = -const
+    return coeff * Symbol(name) + const
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_side_cached(expr_str: str, var_key: tuple):
+    """Cached worker for :func:`_parse_side` — SymPy expressions are
+    immutable, so sharing a parsed result between callers is safe."""
+    s = expr_str.strip()
+    simple = _parse_simple_side(s, var_key)
+    if simple is not None:
+        return simple
+    s = s.replace('^', '**')
+    local = {name: Symbol(name) for name in var_key}
     # Expand multi-letter var tokens before parsing so Python keywords
     # (as, in, for, …) are never handed to parse_expr.
     s = _expand_implicit_vars(s, set(local.keys()))
@@ -115,6 +185,31 @@ def _frac(num, den) -> str:
     return f"{_FRAC_OPEN}{num}{_FRAC_SEP}{den}{_FRAC_CLOSE}"
 
 
+# All fraction shapes _format_expr turns into markers, in one pattern:
+#   (expr)/number   — e.g. (2x + 3)/5
+#   token/number    — e.g. x/2, 3/4, -1/2, 2x/3
+#   number/variable — e.g. 1/x, 2/y (SymPy prints these for x⁻¹ or 1/x)
+# Only numeric numerators are taken for variable denominators so complex
+# expressions that weren't already parenthesised are left alone.  The
+# lookahead yields to a token/number fraction starting in the denominator
+# (``1/x/2`` → ``1/⟦x|2⟧``), which takes precedence.
+_FRAC_RE = re.compile(
+    r'\((?P<pnum>[^)]+)\)/(?P<pden>\d+)'
+    r'|(?P<snum>-?[A-Za-z0-9·]+)/(?P<sden>\d+)'
+    r'|(?P<vnum>-?[0-9]+)/(?![A-Za-z0-9·]*/\d)(?P<vden>[A-Za-z][A-Za-z0-9]*)'
+)
+
+
+def _frac_repl(m) -> str:
+    """``_FRAC_RE`` callback — wrap whichever fraction matched in a marker."""
+    if m.group('pnum') is not None:
+        # Simple fractions inside the parentheses are converted too.
+        return _frac(_FRAC_RE.sub(_frac_repl, m.group('pnum')), m.group('pden'))
+    if m.group('snum') is not None:
+        return _frac(m.group('snum'), m.group('sden'))
+    return _frac(m.group('vnum'), m.group('vden'))
+
+
 # Superscript characters used in exponents — must NOT be treated as operators.
 _SUP_CHARS = (
     "\u00b2\u00b3\u00b9"                          # ²³¹
@@ -180,9 +275,14 @@ def _normalize_spacing(s: str) -> str:
     return re.sub(r'  +', ' ', joined)
 
 
+@functools.lru_cache(maxsize=4096, typed=True)
 def _format_expr(expr) -> str:
     """Format a SymPy expression into a readable string with Unicode
-    superscript exponents and stacked-fraction markers."""
+    superscript exponents and stacked-fraction markers.
+
+    Memoised: the solvers format the same intermediate expressions in
+    several steps and again during verification.  SymPy expressions are
+    immutable and compare structurally, so equal keys format identically."""
     s = str(expr)
 
     # Convert exponents (**N or **(-N) etc.) to superscript
@@ -203,30 +303,16 @@ def _format_expr(expr) -> str:
     s = s.replace('*', '·')
 
     # Convert fraction patterns to stacked-fraction markers ⟦num|den⟧
-    # Match (expr)/number  — e.g. (2x + 3)/5
-    def _paren_frac_repl(m):
-        return _frac(m.group(1), m.group(2))
-    s = re.sub(r'\(([^)]+)\)/(\d+)', _paren_frac_repl, s)
-
-    # Match simple fractions: token/number — e.g. x/2, 3/4, -1/2, 2x/3
-    def _simple_frac_repl(m):
-        return _frac(m.group(1), m.group(2))
-    s = re.sub(r'(-?[A-Za-z0-9·]+)/(\d+)', _simple_frac_repl, s)
-
-    # Match fractions with variable denominators — e.g. 1/x, 2/y (SymPy
-    # outputs these when the user had x⁻¹ or typed 1/x)
-    # Only match numeric-or-simple-token numerators so we don’t eat complex
-    # expressions that weren’t already wrapped in the paren pass above.
-    def _var_frac_repl(m):
-        return _frac(m.group(1), m.group(2))
-    s = re.sub(r'(-?[0-9]+)/([A-Za-z][A-Za-z0-9]*)', _var_frac_repl, s)
+    s = _FRAC_RE.sub(_frac_repl, s)
 
     return _prettify_symbols(_normalize_spacing(s))
 
 
+@functools.lru_cache(maxsize=4096, typed=True)
 def _format_expr_plain(expr) -> str:
     """Like _format_expr but without fraction markers — for use as
-    denominators / inside explanations where nesting would break."""
+    denominators / inside explanations where nesting would break.
+    Memoised like :func:`_format_expr`."""
     s = str(expr)
     def _sup_repl(m):
         exp_text = m.group(1)
@@ -241,6 +327,7 @@ def _format_expr_plain(expr) -> str:
     return _prettify_symbols(_normalize_spacing(s))
 
 
+@functools.lru_cache(maxsize=1024)
 def _format_input_str(raw: str) -> str:
     """Format a RAW user-typed equation side for display.
 
@@ -346,6 +433,37 @@ def _has_var_in_denominator(expr, var_symbols) -> bool:
     return False
 
 
+def _poly_degrees(expr, var_symbols_list: list) -> tuple:
+    """Return ``(max_single_degree, total_degree)`` of *expr* in the variables.
+
+    One multivariate ``Poly`` yields every per-variable degree through
+    ``degree_list()``.  Only when *expr* is not a polynomial in all the
+    variables at once do we fall back to one ``Poly`` per variable.
+    """
+    if _is_rational_linear(expr, var_symbols_list):
+        deg = 1 if any(expr.coeff(vs) != 0 for vs in var_symbols_list) else 0
+        return deg, deg
+    try:
+        total_poly = expr.as_poly(*var_symbols_list)
+    except Exception:
+        total_poly = None
+    if total_poly is not None:
+        return (max(0, *total_poly.degree_list()),
+                max(0, total_poly.total_degree()))
+
+    max_single = 0
+    for vs in var_symbols_list:
+        p = expr.as_poly(vs)
+        if p is not None and p.degree() > max_single:
+            max_single = p.degree()
+    return max_single, 0
+
+
+def _highest_degree(expr, var_symbols_list: list) -> int:
+    """Highest per-variable or total degree, so x·y counts as degree 2."""
+    return max(_poly_degrees(expr, var_symbols_list))
+
+
 def _detect_nonlinear_reason(combined_expanded, var_symbols_list: list,
                               highest_deg: int) -> str:
     """Return 'transcendental', 'denominator', 'product', or 'degree'."""
@@ -355,11 +473,7 @@ def _detect_nonlinear_reason(combined_expanded, var_symbols_list: list,
         return "denominator"
     # Distinguish product-of-variables (total deg ≥ 2, each var alone deg ≤ 1)
     if len(var_symbols_list) > 1 and highest_deg >= 2:
-        max_single = 0
-        for vs in var_symbols_list:
-            p = combined_expanded.as_poly(vs)
-            if p is not None and p.degree() > max_single:
-                max_single = p.degree()
+        max_single, _ = _poly_degrees(combined_expanded, var_symbols_list)
         if max_single <= 1:
             return "product"
     return "degree"
@@ -368,8 +482,6 @@ def _detect_nonlinear_reason(combined_expanded, var_symbols_list: list,
 def _build_educational_message(reason: str, highest_deg: int,
                                var_names: list) -> str:
     """Return a multi-line educational message explaining non-linearity."""
-    deg_sym = _to_superscript(str(highest_deg)) if highest_deg >= 2 else ""
-
     if reason == "transcendental":
         return (
             "This equation contains a transcendental function.\n"
@@ -453,10 +565,6 @@ def _nonlinear_error_result(equation_str: str, lhs_str: str, rhs_str: str,
     _fmt_input_rhs = _format_input_str(rhs_str)
     _fmt_input_eq  = _format_input_eq(lhs_str, rhs_str)
 
-    # SymPy-canonical versions are still needed for step-2 and plain text.
-    _fmt_nl_lhs = _format_expr(lhs)
-    _fmt_nl_rhs = _format_expr(rhs)
-
     # Step 1: show original — use the INPUT form, not SymPy canonical
     steps.append({
         "description": "Starting with the original equation",
@@ -486,21 +594,10 @@ def _nonlinear_error_result(equation_str: str, lhs_str: str, rhs_str: str,
 
     # Compute the effective highest degree (used for degree-based messages)
     combined = expand(lhs - rhs)
-    var_symbols_list = [symbols(v) for v in var_names]
-
-    max_single_var_deg = 0
-    for vs in var_symbols_list:
-        p = combined.as_poly(vs)
-        if p is not None and p.degree() > max_single_var_deg:
-            max_single_var_deg = p.degree()
+    var_symbols_list = [_sym(v) for v in var_names]
 
-    highest_deg = max_single_var_deg
-    try:
-        total_poly = combined.as_poly(*var_symbols_list)
-        if total_poly is not None and total_poly.total_degree() > highest_deg:
-            highest_deg = total_poly.total_degree()
-    except Exception:
-        pass
+    max_single_var_deg, total_deg = _poly_degrees(combined, var_symbols_list)
+    highest_deg = max(max_single_var_deg, total_deg)
 
     if highest_deg < 2:
         highest_deg = degree  # fallback to what the caller passed
@@ -584,13 +681,152 @@ def _nonlinear_error_result(equation_str: str, lhs_str: str, rhs_str: str,
             "total_steps": len(steps),
             "verification_steps": 0,
             "validation_status": "fail",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "library": f"SymPy {sympy.__version__}",
+            "timestamp": _now_str(),
+            "library": _SYMPY_LIB,
             "python": None,
         },
     }
 
 
+def _is_monomial_atom(expr) -> bool:
+    """True for an atom (number, symbol, π) or a number times an atom (``2x/3``).
+
+    Such terms are already expanded and in simplest form.
+    """
+    if expr.is_Atom:
+        return True
+    return (expr.is_Mul and len(expr.args) == 2
+            and expr.args[0].is_Number and expr.args[1].is_Atom)
+
+
+def _simplify(expr):
+    """``simplify`` that skips expressions it would return unchanged.
+
+    The linear steps and the verification substitutions mostly produce
+    plain numbers and ``c·x`` terms, and ``simplify``'s heuristic search is
+    by far the most expensive call in a solve.
+    """
+    if _is_monomial_atom(expr):
+        return expr
+    return simplify(expr)
+
+
+def _substitute_display(text: str, var_name: str, value: str) -> str:
+    """Replace the variable *var_name* in formatted *text* with ``(value)``.
+
+    Only standalone occurrences are replaced — letters that are part of a
+    longer name such as ``log`` or ``exp`` are left alone — so substituting
+    ``l`` into ``log(2)l`` gives ``log(2)(value)``.
+    """
+    return _substitute_display_all(text, {var_name: value})
+
+
+def _substitute_display_all(text: str, values: dict) -> str:
+    """:func:`_substitute_display` for several variables in a single pass.
+
+    Every variable is replaced at once, so a value that happens to contain
+    another variable's letter is never substituted into again.
+    """
+    pattern = _standalone_vars_re(tuple(values))
+    return pattern.sub(lambda m: f'({values[m.group()]})', text)
+
+
+@functools.lru_cache(maxsize=256)
+def _standalone_vars_re(var_names: tuple):
+    alternatives = '|'.join(re.escape(name) for name in var_names)
+    return re.compile(rf'(?<![A-Za-z])(?:{alternatives})(?![A-Za-z])')
+
+
+def _is_rational_linear(expr, var_symbols: list) -> bool:
+    """True when expanded *expr* is ``a₁·v₁ + … + c`` with rational numbers only.
+
+    A cheap structural test — one pass over the terms — that lets callers
+    skip ``Poly`` construction and ``solve`` for the common textbook case.
+    """
+    allowed = set(var_symbols)
+    for term in Add.make_args(expr):
+        c, m = term.as_coeff_Mul()
+        if not c.is_Rational or not (m is S.One or m in allowed):
+            return False
+    return True
+
+
+def _single_var_degree(expr, var):
+    """Degree of expanded *expr* in *var*, or ``None`` if not a polynomial.
+
+    Rational ``a·x + b`` is answered directly (1, or 0 once *x* cancels);
+    anything else goes through ``as_poly``.
+    """
+    if _is_rational_linear(expr, [var]):
+        return 1 if expr.coeff(var) != 0 else 0
+    poly = expr.as_poly(var)
+    return None if poly is None else poly.degree()
+
+
+def _linsolve_dicts(equations: list, var_symbols: list) -> list:
+    """``solve(equations, var_symbols, dict=True)`` for rational linear systems.
+
+    ``linsolve`` goes straight to Gauss-Jordan elimination and, on rational
+    coefficients, yields the same expressions as ``solve`` many times faster.
+    Its result is converted to ``solve``'s shape: ``[]`` when inconsistent,
+    otherwise one dict that leaves out the free variables.
+    """
+    result = linsolve(equations, var_symbols)
+    if not result:
+        return []
+    (values,) = result
+    return [{vs: val for vs, val in zip(var_symbols, values) if val != vs}]
+
+
+def _isolate_rational_linear(combined, var_symbols: list, vs):
+    """Solve ``combined = 0`` for *vs* without going through ``solve``.
+
+    Only handles a linear *combined* whose coefficients are all rational
+    numbers; there ``-(combined - a·vs) / a`` is exactly what ``solve``
+    returns.  Returns a list like ``solve`` does, or ``None`` when the
+    expression is outside that shape and the caller should use ``solve``.
+    """
+    if not _is_rational_linear(combined, var_symbols):
+        return None
+    a = combined.coeff(vs)
+    if a == 0:
+        return []
+    return [-(combined - a * vs) / a]
+
+
+def _cramer_2x2(equations: list, var_symbols: list):
+    """Solve a rational linear 2×2 system by Cramer's rule.
+
+    Each equation is read as ``a·v₀ + b·v₁ = c``.  Returns ``[solution]``
+    like ``_linsolve_dicts``, or ``None`` when the determinant is zero —
+    inconsistent and underdetermined systems are left to ``linsolve``.
+    """
+    vs0, vs1 = var_symbols
+    rows = []
+    for eq_obj in equations:
+        combined = eq_obj.lhs - eq_obj.rhs
+        a = combined.coeff(vs0)
+        b = combined.coeff(vs1)
+        rows.append((a, b, a * vs0 + b * vs1 - combined))
+    (a1, b1, c1), (a2, b2, c2) = rows
+    det = a1 * b2 - a2 * b1
+    if det == 0:
+        return None
+    return [{vs0: (c1 * b2 - c2 * b1) / det, vs1: (a1 * c2 - a2 * c1) / det}]
+
+
+def _subtract_expanded(expr, term):
+    """Return ``expand(expr - term)`` for an *expr* that is already expanded.
+
+    Only *term* needs distributing; Add's own flattening then combines the
+    like terms, so the whole side is not walked by ``expand`` again.  A
+    plain ``c·x`` or constant term is subtracted without calling it at all.
+    """
+    if _is_monomial_atom(term):
+        return expr - term
+    return expr - expand(term)
+
+
 def _count_terms_in_str(expr_str: str) -> int:
     """Count the number of top-level additive terms in an expression string.
 
@@ -618,20 +854,25 @@ def _count_terms_in_str(expr_str: str) -> int:
     return count
 
 
+# √ and π to parser-friendly text; square / curly brackets to parentheses
+_UNICODE_INPUT = str.maketrans({
+    '\u221a': 'sqrt', '\u03c0': '(pi)',
+    '[': '(', ']': ')', '{': '(', '}': ')',
+})
+_SYSTEM_SPLIT_RE = re.compile(r'\s*[;,]\s*')
+_ALLOWED_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz"
+                           "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+                           "0123456789"
+                           " \t+-*/^=()[]{}.,;:\u03c0\u221a")
+
+
 def _validate_characters(equation_str: str) -> None:
     """Reject equations that contain characters outside the allowed set.
 
     Allowed: letters, digits, whitespace, and the math symbols
     + - * / ^ = ( ) . , ;
     """
-    allowed = set("abcdefghijklmnopqrstuvwxyz"
-                  "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-                  "0123456789"
-                  " \t+-*/^=()[]{}.,;:\u03c0\u221a")
-    bad = set()
-    for ch in equation_str:
-        if ch not in allowed:
-            bad.add(ch)
+    bad = set(equation_str) - _ALLOWED_CHARS
     if bad:
         bad_sorted = " ".join(sorted(bad))
         raise ValueError(
@@ -641,7 +882,7 @@ def _validate_characters(equation_str: str) -> None:
         )
 
 
-def solve_linear_equation(equation_str: str) -> dict:
+def solve_linear_equation(equation_str: str, *, detailed: bool = True) -> dict:
     """
     Solve one or more linear equations step by step.
 
@@ -650,28 +891,29 @@ def solve_linear_equation(equation_str: str) -> dict:
       - Multiple variables:  ``2x + 4y = 1``
       - Systems (comma / semicolon separated):  ``x + y = 10, x - y = 2``
 
+    With ``detailed=False`` a 2×2 system skips the substitution walkthrough
+    and reports the solution in a single step.
+
     Returns a dict with trail-format sections:
       - given, method, steps, final_answer, verification_steps, summary
     """
     t_start = time.perf_counter()
 
     # ── Normalise Unicode symbols to parser-friendly equivalents ─────
-    equation_str = equation_str.replace('\u221a', 'sqrt')
-    equation_str = equation_str.replace('\u03c0', '(pi)')
-    equation_str = equation_str.replace('[', '(').replace(']', ')')
-    equation_str = equation_str.replace('{', '(').replace('}', ')')
+    equation_str = equation_str.translate(_UNICODE_INPUT)
 
     # ── Validate input characters ───────────────────────────────────────
     _validate_characters(equation_str)
 
     # ── Split by , or ; to detect a system ──────────────────────────────
-    raw_equations = [eq.strip() for eq in re.split(r'\s*[;,]\s*', equation_str)
+    raw_equations = [eq.strip() for eq in _SYSTEM_SPLIT_RE.split(equation_str)
                      if eq.strip()]
     all_text = ' '.join(raw_equations)
     var_names = _detect_variables(all_text)
 
     if len(raw_equations) > 1:
-        return _solve_system(raw_equations, var_names, equation_str, t_start)
+        return _solve_system(raw_equations, var_names, equation_str, t_start,
+                             detailed=detailed)
     if len(var_names) > 1:
         return _solve_multi_var_single_eq(equation_str, var_names, t_start)
 
@@ -679,24 +921,27 @@ def solve_linear_equation(equation_str: str) -> dict:
     if '=' not in equation_str:
         raise ValueError("Equation must contain '='. Example: 3x + 2 = 7")
 
-    parts = equation_str.split('=')
-    if len(parts) != 2:
+    before, _, after = equation_str.partition('=')
+    if '=' in after:
         raise ValueError("Equation must contain exactly one '=' sign.")
 
-    lhs_str, rhs_str = parts[0].strip(), parts[1].strip()
+    lhs_str, rhs_str = before.strip(), after.strip()
     if not lhs_str or not rhs_str:
         raise ValueError("Both sides of the equation must have expressions.")
 
     var_name = var_names[0]
-    var = symbols(var_name)
+    var = _sym(var_name)
 
     lhs = _parse_side(lhs_str, var)
     rhs = _parse_side(rhs_str, var)
+    # The steps below rebind lhs/rhs; keep the parsed originals for
+    # the verification section instead of parsing the input again.
+    lhs_orig, rhs_orig = lhs, rhs
 
     # Verify it's linear in the detected variable
     combined = lhs - rhs
     combined_expanded = expand(combined)
-    poly_degree = combined_expanded.as_poly(var)
+    poly_degree = _single_var_degree(combined_expanded, var)
     if poly_degree is None:
         if var not in combined_expanded.free_symbols:
             # Degenerate: variable was present in the original text but
@@ -715,19 +960,19 @@ def solve_linear_equation(equation_str: str) -> dict:
             )
         else:
             raise ValueError("Could not determine the degree. Please check the equation.")
-    elif poly_degree.degree() > 1:
+    elif poly_degree > 1:
         return _nonlinear_error_result(
             equation_str, lhs_str, rhs_str, lhs, rhs,
-            [var_name], poly_degree.degree(), t_start,
+            [var_name], poly_degree, t_start,
         )
-    elif poly_degree.degree() == 0:
+    elif poly_degree == 0:
         # Non-zero constant: variable present in input but fully cancelled
         # (e.g. 2x - 4 = 2x + 7 → -11 = 0).  Same treatment as above.
         pass
 
     steps = []
-    original_lhs_str = equation_str.split('=')[0].strip()
-    original_rhs_str = equation_str.split('=')[1].strip()
+    original_lhs_str = lhs_str
+    original_rhs_str = rhs_str
 
     # Step 0: Original equation — show EXACTLY what the user typed.
     # _format_input_str applies only visual fixes (superscripts, fraction
@@ -753,10 +998,9 @@ def solve_linear_equation(equation_str: str) -> dict:
     _rhs_term_changed = _orig_rhs_terms != _parsed_rhs_terms
     # Also detect when parentheses disappeared (expansion + combining may
     # leave the same term count, e.g. "2(x+1) + 3x" → "5x + 2").
-    _parens_gone = (
-        ('(' in original_lhs_str and '(' not in _format_expr(lhs)) or
-        ('(' in original_rhs_str and '(' not in _format_expr(rhs))
-    )
+    _lhs_parens_gone = '(' in original_lhs_str and '(' not in _format_expr(lhs)
+    _rhs_parens_gone = '(' in original_rhs_str and '(' not in _format_expr(rhs)
+    _parens_gone = _lhs_parens_gone or _rhs_parens_gone
 
     if _lhs_term_changed or _rhs_term_changed or _parens_gone:
         _has_parens = '(' in original_lhs_str or '(' in original_rhs_str
@@ -775,8 +1019,8 @@ def solve_linear_equation(equation_str: str) -> dict:
             desc = "Combine like terms"
 
         parts = []
-        _lhs_changed = _lhs_term_changed or ('(' in original_lhs_str and '(' not in _format_expr(lhs))
-        _rhs_changed = _rhs_term_changed or ('(' in original_rhs_str and '(' not in _format_expr(rhs))
+        _lhs_changed = _lhs_term_changed or _lhs_parens_gone
+        _rhs_changed = _rhs_term_changed or _rhs_parens_gone
         if _lhs_changed:
             action = "expands and combines to" if '(' in original_lhs_str else "combines to"
             parts.append(
@@ -818,10 +1062,9 @@ def solve_linear_equation(equation_str: str) -> dict:
         lhs, rhs = lhs_expanded, rhs_expanded
 
     # --- Step 2: Collect variable terms on the left, constants on the right ---
-    lhs_x_coeff = lhs.coeff(var)
-    lhs_const = lhs - lhs_x_coeff * var
+    # From here on both sides stay expanded, so each move only has to
+    # expand the term being moved (see _subtract_expanded).
     rhs_x_coeff = rhs.coeff(var)
-    rhs_const = rhs - rhs_x_coeff * var
 
     new_lhs = lhs
     new_rhs = rhs
@@ -854,8 +1097,8 @@ def solve_linear_equation(equation_str: str) -> dict:
             "expression": work_expr,
             "explanation": explanation,
         })
-        new_lhs = expand(lhs - subtract_term)
-        new_rhs = expand(rhs - subtract_term)
+        new_lhs = _subtract_expanded(lhs, subtract_term)
+        new_rhs = _subtract_expanded(rhs, subtract_term)
         steps.append({
             "description": "Simplify both sides",
             "expression": _format_equation(new_lhs, new_rhs),
@@ -865,7 +1108,8 @@ def solve_linear_equation(equation_str: str) -> dict:
 
     # Move constant terms from left to right
     lhs_x_coeff_now = lhs.coeff(var)
-    lhs_const_now = expand(lhs - lhs_x_coeff_now * var)
+    coeff_source = lhs  # side lhs_x_coeff_now was read from
+    lhs_const_now = _subtract_expanded(lhs, lhs_x_coeff_now * var)
     if lhs_const_now != 0:
         const_str       = _format_expr(lhs_const_now)        # for expressions
         const_str_plain = _format_expr_plain(lhs_const_now)  # for prose text
@@ -892,8 +1136,8 @@ def solve_linear_equation(equation_str: str) -> dict:
             "expression": work_expr,
             "explanation": explanation,
         })
-        new_lhs = expand(lhs - lhs_const_now)
-        new_rhs = expand(rhs - lhs_const_now)
+        new_lhs = _subtract_expanded(lhs, lhs_const_now)
+        new_rhs = _subtract_expanded(rhs, lhs_const_now)
         steps.append({
             "description": "Simplify both sides",
             "expression": _format_equation(new_lhs, new_rhs),
@@ -902,8 +1146,8 @@ def solve_linear_equation(equation_str: str) -> dict:
         lhs, rhs = new_lhs, new_rhs
 
     # --- Step 3: Simplify both sides ---
-    lhs_simplified = simplify(lhs)
-    rhs_simplified = simplify(rhs)
+    lhs_simplified = _simplify(lhs)
+    rhs_simplified = _simplify(rhs)
     if lhs_simplified != lhs or rhs_simplified != rhs:
         lhs, rhs = lhs_simplified, rhs_simplified
         steps.append({
@@ -913,10 +1157,11 @@ def solve_linear_equation(equation_str: str) -> dict:
         })
 
     # --- Step 4: Divide both sides by the coefficient of the variable ---
-    coeff = lhs.coeff(var)
+    # Reuse the coefficient read above unless the left side has changed since.
+    coeff = lhs_x_coeff_now if lhs is coeff_source else lhs.coeff(var)
     if coeff == 0:
         # The variable cancelled out — degenerate equation.
-        rhs_val = simplify(rhs)
+        rhs_val = _simplify(rhs)
         is_identity = (rhs_val == 0)
 
         if is_identity:
@@ -982,8 +1227,8 @@ def solve_linear_equation(equation_str: str) -> dict:
             "total_steps": len(steps),
             "verification_steps": 0,
             "validation_status": "pass",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "library": f"SymPy {sympy.__version__}",
+            "timestamp": _now_str(),
+            "library": _SYMPY_LIB,
             "python": None,
         }
         return {
@@ -1017,18 +1262,17 @@ def solve_linear_equation(equation_str: str) -> dict:
                 f"dividing {_format_expr_plain(rhs)} by {coeff_str_plain} gives us the value."
             ),
         })
-        solution = simplify(rhs / coeff)
+        solution = _simplify(rhs / coeff)
         steps.append({
             "description": "Simplify to get the answer",
             "expression": f"{var_name} = {_format_expr(solution)}",
             "explanation": f"Performing the division: {_format_expr_plain(rhs)} ÷ {coeff_str_plain} = {_format_expr_plain(solution)}. So {var_name} equals {_format_expr_plain(solution)}.",
         })
     else:
-        solution = simplify(rhs)
+        solution = _simplify(rhs)
 
     # Build verification steps
-    lhs_check = _parse_side(equation_str.split('=')[0], var)
-    rhs_check = _parse_side(equation_str.split('=')[1], var)
+    lhs_check, rhs_check = lhs_orig, rhs_orig
     sol_str_expr  = _format_expr(solution)        # for expressions
     sol_str_plain = _format_expr_plain(solution)  # for prose text
     sol_str = sol_str_expr  # kept for final_answer expression
@@ -1044,8 +1288,8 @@ def solve_linear_equation(equation_str: str) -> dict:
     })
 
     # Step 2: Show substitution
-    lhs_substituted_str = _format_expr(lhs_check).replace(var_name, f'({sol_str_plain})')
-    rhs_substituted_str = _format_expr(rhs_check).replace(var_name, f'({sol_str_plain})')
+    lhs_substituted_str = _substitute_display(_format_expr(lhs_check), var_name, sol_str_plain)
+    rhs_substituted_str = _substitute_display(_format_expr(rhs_check), var_name, sol_str_plain)
     verification_steps.append({
         "description": f"Substitute {var_name} = {sol_str_plain} into both sides",
         "expression": f"{lhs_substituted_str} = {rhs_substituted_str}",
@@ -1053,7 +1297,9 @@ def solve_linear_equation(equation_str: str) -> dict:
     })
 
     # Step 3: Evaluate LHS
-    lhs_val = simplify(lhs_check.subs(var, solution))
+    # xreplace is a plain structural swap of the symbol — the parsed sides
+    # hold no derivatives or other objects that need subs()'s extra logic.
+    lhs_val = _simplify(lhs_check.xreplace({var: solution}))
     verification_steps.append({
         "description": "Evaluate the left-hand side",
         "expression": f"LHS = {lhs_substituted_str} = {_format_expr(lhs_val)}",
@@ -1061,7 +1307,7 @@ def solve_linear_equation(equation_str: str) -> dict:
     })
 
     # Step 4: Evaluate RHS
-    rhs_val = simplify(rhs_check.subs(var, solution))
+    rhs_val = _simplify(rhs_check.xreplace({var: solution}))
     verification_steps.append({
         "description": "Evaluate the right-hand side",
         "expression": f"RHS = {rhs_substituted_str} = {_format_expr(rhs_val)}",
@@ -1112,8 +1358,8 @@ def solve_linear_equation(equation_str: str) -> dict:
         "total_steps": len(steps),
         "verification_steps": len(verification_steps),
         "validation_status": "pass",
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "library": f"SymPy {sympy.__version__}",
+        "timestamp": _now_str(),
+        "library": _SYMPY_LIB,
         "python": None,  # filled by caller if desired
     }
 
@@ -1136,7 +1382,7 @@ def _solve_multi_var_single_eq(equation_str: str, var_names: list,
 
     Expresses each variable in terms of the remaining ones.
     """
-    var_symbols = [symbols(v) for v in var_names]
+    var_symbols = [_sym(v) for v in var_names]
 
     if '=' not in equation_str:
         raise ValueError("Equation must contain '='. Example: 2x + 4y = 1")
@@ -1153,22 +1399,11 @@ def _solve_multi_var_single_eq(equation_str: str, var_names: list,
     # Cache formatted originals before any modification
     _fmt_mv_lhs = _format_expr(lhs)
     _fmt_mv_rhs = _format_expr(rhs)
-    _fmt_mv_eq  = _format_equation(lhs, rhs)
+    _fmt_mv_eq  = f"{_fmt_mv_lhs} = {_fmt_mv_rhs}"
 
     # Verify linearity
     combined = expand(lhs - rhs)
-    max_degree = 0
-    for vs in var_symbols:
-        p = combined.as_poly(vs)
-        if p is not None and p.degree() > max_degree:
-            max_degree = p.degree()
-    # Also check total degree (catches products like x·y which are degree 2)
-    try:
-        total_poly = combined.as_poly(*var_symbols)
-        if total_poly is not None and total_poly.total_degree() > max_degree:
-            max_degree = total_poly.total_degree()
-    except Exception:
-        pass
+    max_degree = _highest_degree(combined, var_symbols)
     # Check transcendental / denominator before the degree test
     # (these make as_poly return None, leaving max_degree misleadingly at 0/1)
     if _has_transcendental(combined, var_symbols):
@@ -1213,14 +1448,10 @@ def _solve_multi_var_single_eq(equation_str: str, var_names: list,
     # Combine like terms step: show if any variable appears >1 time in the
     # original string on either side (SymPy combines silently on parse).
     def _has_duplicate_vars(side_str, v_names):
-        for vn in v_names:
-            # count isolated occurrences of this variable letter
-            if len(re.findall(r'\b' + re.escape(vn) + r'\b', side_str)) >= 2:
-                return True
-            # also catch cases like o+o where regex word boundary might miss
-            if side_str.count(vn) >= 2:
-                return True
-        return False
+        # A plain substring count: every word-bounded match is also a
+        # substring occurrence, and it still catches "2x + 3x" where \b
+        # finds no boundary between the digit and the letter.
+        return any(side_str.count(vn) >= 2 for vn in v_names)
 
     if _has_duplicate_vars(lhs_str, var_names) or _has_duplicate_vars(rhs_str, var_names):
         lhs_combined = expand(lhs)
@@ -1239,7 +1470,9 @@ def _solve_multi_var_single_eq(equation_str: str, var_names: list,
     eq = Eq(lhs, rhs)
     solutions = {}
     for vn, vs in zip(var_names, var_symbols):
-        sol = solve(eq, vs)
+        sol = _isolate_rational_linear(combined, var_symbols, vs)
+        if sol is None:
+            sol = solve(eq, vs)
         if sol:
             solutions[vn] = sol[0]
             others = [v for v in var_names if v != vn]
@@ -1265,8 +1498,8 @@ def _solve_multi_var_single_eq(equation_str: str, var_names: list,
         first_vs = var_symbols[0]
         sol_expr = solutions.get(first_vn)
         if sol_expr is not None:
-            lhs_sub = simplify(lhs.subs(first_vs, sol_expr))
-            rhs_sub = simplify(rhs.subs(first_vs, sol_expr))
+            lhs_sub = _simplify(lhs.subs(first_vs, sol_expr))
+            rhs_sub = _simplify(rhs.subs(first_vs, sol_expr))
             verification_steps.append({
                 "description": f"Substitute {first_vn} = {_format_expr(sol_expr)}",
                 "expression": f"LHS = {_format_expr(lhs_sub)},  RHS = {_format_expr(rhs_sub)}",
@@ -1324,19 +1557,21 @@ def _solve_multi_var_single_eq(equation_str: str, var_names: list,
             "total_steps": len(steps),
             "verification_steps": len(verification_steps),
             "validation_status": "pass",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "library": f"SymPy {sympy.__version__}",
+            "timestamp": _now_str(),
+            "library": _SYMPY_LIB,
             "python": None,
         },
     }
 
 
 def _solve_system(raw_equations: list, var_names: list,
-                  original_input: str, t_start: float) -> dict:
+                  original_input: str, t_start: float,
+                  detailed: bool = True) -> dict:
     """Solve a system of linear equations."""
-    var_symbols = [symbols(v) for v in var_names]
+    var_symbols = [_sym(v) for v in var_names]
     n_eq = len(raw_equations)
     n_var = len(var_names)
+    substitution_method = detailed and n_eq == 2 and n_var == 2
 
     # Parse every equation
     eq_objects = []
@@ -1354,18 +1589,10 @@ def _solve_system(raw_equations: list, var_names: list,
 
     # Verify linearity
     for i, eq_obj in enumerate(eq_objects):
-        combined = expand(eq_obj.lhs - eq_obj.rhs)
-        max_deg = 0
-        for vs in var_symbols:
-            p = combined.as_poly(vs)
-            if p is not None and p.degree() > max_deg:
-                max_deg = p.degree()
-        try:
-            total_poly = combined.as_poly(*var_symbols)
-            if total_poly is not None and total_poly.total_degree() > max_deg:
-                max_deg = total_poly.total_degree()
-        except Exception:
-            pass
+        # Both sides were expanded when the Eq was built, and the difference
+        # of two expanded sums is already expanded — no third expand().
+        combined = eq_obj.lhs - eq_obj.rhs
+        max_deg = _highest_degree(combined, var_symbols)
         eq_str_i = raw_equations[i]
         eq_parts_i = eq_str_i.split('=')
         _nl_lhs_s = eq_parts_i[0].strip() if len(eq_parts_i) == 2 else eq_str_i
@@ -1406,7 +1633,18 @@ def _solve_system(raw_equations: list, var_names: list,
     })
 
     # Solve
-    solution = solve(eq_objects, var_symbols, dict=True)
+    is_rational_system = all(
+        _is_rational_linear(eq_obj.lhs - eq_obj.rhs, var_symbols)
+        for eq_obj in eq_objects
+    )
+    solution = None
+    if is_rational_system and n_eq == 2 and n_var == 2:
+        solution = _cramer_2x2(eq_objects, var_symbols)
+    if solution is None:
+        if is_rational_system:
+            solution = _linsolve_dicts(eq_objects, var_symbols)
+        else:
+            solution = solve(eq_objects, var_symbols, dict=True)
     if not solution:
         # Show elimination steps to expose the contradiction, then return
         # a proper result dict instead of raising an error.
@@ -1494,29 +1732,43 @@ def _solve_system(raw_equations: list, var_names: list,
                 "total_steps": len(steps),
                 "verification_steps": 0,
                 "validation_status": "pass",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "library": f"SymPy {sympy.__version__}",
+                "timestamp": _now_str(),
+                "library": _SYMPY_LIB,
                 "python": None,
             },
         }
 
     sol_dict = solution[0]
-    free_vars = [
-        vn for vn, vs in zip(var_names, var_symbols) if vs not in sol_dict
-    ]
+    # Free variables and the final-answer lines in one pass over the unknowns
+    free_vars = []
+    final_parts = []
+    for vn, vs in zip(var_names, var_symbols):
+        if vs in sol_dict:
+            final_parts.append(f"{vn} = {_format_expr(sol_dict[vs])}")
+        else:
+            free_vars.append(vn)
+            final_parts.append(f"{vn} is a free variable")
 
     # ── Detailed steps for 2×2 systems (substitution method) ────────────
-    if n_eq == 2 and n_var == 2 and not free_vars:
+    if substitution_method and not free_vars:
         eq1, eq2 = eq_objects
         vs0, vs1 = var_symbols
         vn0, vn1 = var_names
 
-        sol_from_eq1 = solve(eq1, vs0)
+        # Rational systems: isolate in closed form, and take the values
+        # below from sol_dict — re-solving gives the same Rationals.
+        sol_from_eq1 = None
+        if is_rational_system:
+            sol_from_eq1 = _isolate_rational_linear(
+                eq1.lhs - eq1.rhs, var_symbols, vs0)
+        if sol_from_eq1 is None:
+            sol_from_eq1 = solve(eq1, vs0)
         if sol_from_eq1:
             expr_v0 = sol_from_eq1[0]
+            fmt_v0 = _format_expr(expr_v0)
             steps.append({
                 "description": f"From equation (1), isolate {vn0}",
-                "expression": f"{vn0} = {_format_expr(expr_v0)}",
+                "expression": f"{vn0} = {fmt_v0}",
                 "explanation": (
                     f"Rearrange equation (1) to express {vn0} in "
                     f"terms of {vn1}."
@@ -1524,37 +1776,44 @@ def _solve_system(raw_equations: list, var_names: list,
             })
 
             eq2_sub = eq2.subs(vs0, expr_v0)
+            # Rational c·v + … sides are already in expanded form
+            if (_is_rational_linear(eq2_sub.lhs, var_symbols)
+                    and _is_rational_linear(eq2_sub.rhs, var_symbols)):
+                eq2_sub_expanded = eq2_sub
+            else:
+                eq2_sub_expanded = eq2_sub.expand()
             steps.append({
                 "description": "Substitute into equation (2)",
                 "expression": _format_equation(
-                    expand(eq2_sub.lhs), expand(eq2_sub.rhs)
+                    eq2_sub_expanded.lhs, eq2_sub_expanded.rhs
                 ),
                 "explanation": (
-                    f"Replace {vn0} in equation (2) with "
-                    f"{_format_expr(expr_v0)}."
+                    f"Replace {vn0} in equation (2) with {fmt_v0}."
                 ),
             })
 
-            sol_v1 = solve(eq2_sub, vs1)
+            sol_v1 = [sol_dict[vs1]] if is_rational_system else solve(eq2_sub, vs1)
             if sol_v1:
                 v1_val = sol_v1[0]
+                fmt_v1 = _format_expr(v1_val)
                 steps.append({
                     "description": f"Solve for {vn1}",
-                    "expression": f"{vn1} = {_format_expr(v1_val)}",
+                    "expression": f"{vn1} = {fmt_v1}",
                     "explanation": (
-                        f"Simplify and solve to find "
-                        f"{vn1} = {_format_expr(v1_val)}."
+                        f"Simplify and solve to find {vn1} = {fmt_v1}."
                     ),
                 })
 
-                v0_val = simplify(expr_v0.subs(vs1, v1_val))
+                v0_val = (sol_dict[vs0] if is_rational_system
+                          else simplify(expr_v0.subs(vs1, v1_val)))
+                fmt_val = _format_expr(v0_val)
                 steps.append({
                     "description": f"Back-substitute to find {vn0}",
-                    "expression": f"{vn0} = {_format_expr(v0_val)}",
+                    "expression": f"{vn0} = {fmt_val}",
                     "explanation": (
-                        f"Substitute {vn1} = {_format_expr(v1_val)} back "
-                        f"into {vn0} = {_format_expr(expr_v0)} to get "
-                        f"{vn0} = {_format_expr(v0_val)}."
+                        f"Substitute {vn1} = {fmt_v1} back "
+                        f"into {vn0} = {fmt_v0} to get "
+                        f"{vn0} = {fmt_val}."
                     ),
                 })
         else:
@@ -1573,16 +1832,8 @@ def _solve_system(raw_equations: list, var_names: list,
                     f"{', '.join(free_vars)} can take any value."
                 ),
             })
-        _append_solution_step(steps, var_names, var_symbols, sol_dict,
-                              free_vars)
+        _append_solution_step(steps, var_names, var_symbols, sol_dict)
 
-    # Final answer
-    final_parts = []
-    for vn, vs in zip(var_names, var_symbols):
-        if vs in sol_dict:
-            final_parts.append(f"{vn} = {_format_expr(sol_dict[vs])}")
-        else:
-            final_parts.append(f"{vn} is a free variable")
     final_answer = "\n".join(final_parts)
 
     # Verification
@@ -1595,18 +1846,23 @@ def _solve_system(raw_equations: list, var_names: list,
         ),
     })
     for i, (eq_str, eq_obj) in enumerate(zip(raw_equations, eq_objects)):
-        lhs_val = simplify(eq_obj.lhs.subs(sol_dict))
-        rhs_val = simplify(eq_obj.rhs.subs(sol_dict))
-        ok = simplify(lhs_val - rhs_val) == 0
+        # sol_dict maps bare symbols to values free of those symbols, so a
+        # single structural xreplace gives the same result as subs().
+        lhs_val = _simplify(eq_obj.lhs.xreplace(sol_dict))
+        rhs_val = _simplify(eq_obj.rhs.xreplace(sol_dict))
+        # Structurally equal sides need no third simplify to confirm.
+        ok = lhs_val == rhs_val or _simplify(lhs_val - rhs_val) == 0
+        fmt_lhs_val = _format_expr(lhs_val)
+        fmt_rhs_val = _format_expr(rhs_val)
         verification_steps.append({
             "description": f"Equation ({i + 1}): {eq_str}",
             "expression": (
-                f"LHS = {_format_expr(lhs_val)},  "
-                f"RHS = {_format_expr(rhs_val)}"
+                f"LHS = {fmt_lhs_val},  "
+                f"RHS = {fmt_rhs_val}"
                 f"  →  {'✓' if ok else '✗'}"
             ),
             "explanation": (
-                f"Both sides equal {_format_expr(lhs_val)}."
+                f"Both sides equal {fmt_lhs_val}."
                 if ok else "Sides differ — please check the input."
             ),
         })
@@ -1625,13 +1881,13 @@ def _solve_system(raw_equations: list, var_names: list,
     runtime_ms = round((t_end - t_start) * 1000, 2)
 
     method_name = (
-        "Substitution Method" if n_eq == 2 and n_var == 2
+        "Substitution Method" if substitution_method
         else "Linear System Solver"
     )
     method_desc = (
         "Isolate one variable, substitute into the other equation, "
         "then back-substitute."
-        if n_eq == 2 and n_var == 2 else
+        if substitution_method else
         "Solve using algebraic elimination / back-substitution."
     )
 
@@ -1657,7 +1913,7 @@ def _solve_system(raw_equations: list, var_names: list,
                 "variables": ", ".join(var_names),
                 "approach": (
                     "Isolate → Substitute → Solve → Back-substitute"
-                    if n_eq == 2 and n_var == 2 else
+                    if substitution_method else
                     "Row reduction → Back-substitution"
                 ),
             },
@@ -1670,22 +1926,20 @@ def _solve_system(raw_equations: list, var_names: list,
             "total_steps": len(steps),
             "verification_steps": len(verification_steps),
             "validation_status": "pass",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "library": f"SymPy {sympy.__version__}",
+            "timestamp": _now_str(),
+            "library": _SYMPY_LIB,
             "python": None,
         },
     }
 
 
-def _append_solution_step(steps, var_names, var_symbols, sol_dict,
-                          free_vars=None):
+def _append_solution_step(steps, var_names, var_symbols, sol_dict):
     """Append a generic 'Solution' step listing all values."""
-    lines = []
-    for vn, vs in zip(var_names, var_symbols):
-        if vs in sol_dict:
-            lines.append(f"{vn} = {_format_expr(sol_dict[vs])}")
-        else:
-            lines.append(f"{vn}  (free variable)")
+    lines = [
+        f"{vn} = {_format_expr(sol_dict[vs])}" if vs in sol_dict
+        else f"{vn}  (free variable)"
+        for vn, vs in zip(var_names, var_symbols)
+    ]
     steps.append({
         "description": "Solution",
         "expression": "\n".join(lines),
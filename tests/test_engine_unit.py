@@ -1,3 +1,5 @@
+import re
+
 import pytest
 from sympy import symbols, sympify
 
@@ -28,6 +30,9 @@ def test_expression_helpers() -> None:
     x = symbols("x")
     expr = engine._parse_side("2x + 1", x)
     assert str(expr) == "2*x + 1"
+    assert engine._parse_side("2x + 1", symbols("x")) is expr
+    assert engine._parse_side("-3x - 7", x) == sympify("-3*x - 7")
+    assert engine._parse_side("3e+2", symbols("e")) == 300  # float literal
     assert engine._to_superscript("12-3") == "¹²⁻³"
     assert engine._frac("1", "2") == "⟦1|2⟧"
     assert "π" in engine._prettify_symbols("2pi + sqrt(x)")
@@ -35,6 +40,8 @@ def test_expression_helpers() -> None:
     assert engine._normalize_spacing("2x+3=5-1") == "2x + 3 = 5 - 1"
     assert "⟦x|2⟧" in engine._format_expr(x / 2)
     assert "⟦" not in engine._format_expr_plain(x / 2)
+    assert engine._format_expr(1 / x) == "⟦1|x⟧"
+    assert engine._format_expr(x / 2 + 1 / x) == "⟦x|2⟧ + ⟦1|x⟧"
 
 
 def test_degree_and_nonlinear_detectors() -> None:
@@ -73,6 +80,7 @@ def test_solve_linear_equation_required_fields_type_and_range_checks() -> None:
     assert isinstance(summary["total_steps"], int) and summary["total_steps"] >= 0
     assert isinstance(summary["verification_steps"], int) and summary["verification_steps"] >= 0
     assert summary["validation_status"] == "pass"
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", summary["timestamp"])
 
 
 def test_nonlinear_trail_logs_validation_fail() -> None:
@@ -88,6 +96,43 @@ def test_system_solution_trail_logs_validation_pass() -> None:
     assert result["summary"]["validation_status"] == "pass"
 
 
+def test_2x2_system_exact_and_singular_cases() -> None:
+    result = engine.solve_linear_equation("3x + 2y = 7, x - y/2 = 4")
+    assert result["final_answer"] == "x = ⟦23|7⟧\ny = ⟦-10|7⟧"
+    result = engine.solve_linear_equation("x + y = 1, 2x + 2y = 5")
+    assert result["final_answer"].startswith("No solution")
+    result = engine.solve_linear_equation("x + y = 1, 2x + 2y = 2")
+    assert "y is a free variable" in result["final_answer"]
+
+
+def test_system_without_detailed_steps_keeps_answer() -> None:
+    eq = "3x + 2y = 7, x - y/2 = 4"
+    full = engine.solve_linear_equation(eq)
+    brief = engine.solve_linear_equation(eq, detailed=False)
+    assert brief["final_answer"] == full["final_answer"]
+    assert brief["method"]["name"] == "Linear System Solver"
+    assert len(brief["steps"]) < len(full["steps"])
+
+
+def test_substitution_display_keeps_function_names_intact() -> None:
+    result = engine.solve_linear_equation("log(2)l + 1 = 3")
+    assert result["verification_steps"][1]["expression"].startswith("(2/log(2))·log(2)")
+
+    result = engine.solve_linear_equation("sin(n) = 0", mode="substitution",
+                                          values_str="n = 0")
+    assert result["steps"][2]["expression"] == "sin((0)) = 0"
+
+    result = engine.solve_linear_equation("x + y = 3", mode="substitution",
+                                          values_str="x = y, y = 1")
+    assert result["steps"][2]["expression"] == "(1) + (1) = 3"
+    assert "= 2" in result["steps"][3]["expression"]
+
+    result = engine.solve_linear_equation("x = y + 1", mode="substitution",
+                                          values_str="x = 2, y = x")
+    assert result["steps"][2]["expression"] == "(2) = (2) + 1"
+    assert result["final_answer"].startswith("2 ≠ 3")
+
+
 def test_invalid_input_missing_equal_sign() -> None:
     with pytest.raises(ValueError, match="must contain '='"):
         engine.solve_linear_equation("2x + 3")
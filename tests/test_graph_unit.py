@@ -62,6 +62,14 @@ def test_parse_eq_valid_and_invalid() -> None:
     assert str(lhs) == "2*x + 1"
     assert str(rhs) == "5"
     assert "x" in local
+    x = local.pop("x")
+    assert "x" in graph._parse_eq("2x + 1 = 5")[2]
+    f = graph._numpy_fn(x, lhs)
+    assert f(2) == 5
+    assert graph._numpy_fn(x, lhs) is f
+    assert graph._numpy_fn(x, 1 / x)(2) == 0.5
+    assert graph._grid_size(x, lhs, rhs) == 200
+    assert graph._grid_size(x, lhs, 1 / x) == 400
 
     try:
         graph._parse_eq("2x + 1")
@@ -92,6 +100,10 @@ def test_analyze_result_dispatch() -> None:
     assert graph.analyze_result(_two_var_result())["eq_type"] == "two_var"
     assert graph.analyze_result(_system_result())["eq_type"] == "system"
 
+    first = graph.analyze_result(_single_var_result())
+    first["case"] = "edited"
+    assert graph.analyze_result(_single_var_result())["case"] != "edited"
+
 
 def test_build_figure_and_restyle() -> None:
     fig = graph.build_figure(_single_var_result())
@@ -128,3 +140,8 @@ def test_direct_builders_smoke() -> None:
 
     fig5 = graph._build_system({"equations": "x+y=10, x-y=2", "variables": "x, y"}, "x = 6\ny = 4")
     assert isinstance(fig5, Figure)
+
+
+def test_system_with_horizontal_line_is_plotted() -> None:
+    fig = graph._build_system({"equations": "x + y = 5, y = 2", "variables": "x, y"}, "x = 3\ny = 2")
+    assert "(3, 2)" in fig.axes[0].get_title()
@@ -1,10 +1,15 @@
 """Tests for the numerical (NumPy) solver and the engine dispatcher."""
 
+import re
+
 import pytest
 import numpy as np
+from sympy import Rational, sqrt
 
 from solver import engine
-from solver.numerical import solve_numeric, _fmt_num
+from solver.numerical import solve_numeric, _fmt_num, _to_float
+
+_ANSWER_RE = re.compile(r"([a-z]+)\s*=\s*(-?\d+(?:\.\d+)?)")
 
 
 # ── _fmt_num helper ──────────────────────────────────────────────────────
@@ -24,6 +29,11 @@ class TestFmtNum:
         assert _fmt_num(3.0000000000001) == "3"
 
 
+def test_to_float_matches_float():
+    for value in (Rational(7, 3), Rational(-1, 10), Rational(5), sqrt(2), 0):
+        assert _to_float(value) == float(value)
+
+
 # ── Single-variable numeric solve ───────────────────────────────────────
 
 class TestSolveNumericSingle:
@@ -39,13 +49,13 @@ class TestSolveNumericSingle:
         assert "x =" in answer
         # Should be a decimal, not a fraction
         val = float(answer.split("=")[1].strip())
-        assert abs(val - 1/3) < 1e-9
+        assert val == pytest.approx(1/3, abs=1e-9)
 
     def test_negative_result(self):
         result = solve_numeric("x + 10 = 3")
         answer = result["final_answer"]
         val = float(answer.split("=")[1].strip())
-        assert abs(val - (-7)) < 1e-9
+        assert val == pytest.approx(-7, abs=1e-9)
 
     def test_has_required_fields(self):
         result = solve_numeric("2x + 2 = 5")
@@ -71,13 +81,9 @@ class TestSolveNumericSystem:
         assert "x =" in answer
         assert "y =" in answer
         # x=6, y=4
-        lines = answer.strip().split("\n")
-        vals = {}
-        for line in lines:
-            var, val = line.split("=")
-            vals[var.strip()] = float(val.strip())
-        assert abs(vals["x"] - 6) < 1e-9
-        assert abs(vals["y"] - 4) < 1e-9
+        vals = {k: float(v) for k, v in _ANSWER_RE.findall(answer)}
+        assert vals["x"] == pytest.approx(6, abs=1e-9)
+        assert vals["y"] == pytest.approx(4, abs=1e-9)
         assert "NumPy" in result["summary"]["library"]
 
     def test_system_verification_present(self):
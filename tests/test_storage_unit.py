@@ -1,10 +1,14 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from gui import storage
 
 
-def _configure_tmp_db(monkeypatch, tmp_path: Path) -> Path:
+@pytest.fixture
+def tmp_db(monkeypatch, tmp_path: Path) -> Path:
+    """Point storage at a fresh ``data/dualsolver.json`` under *tmp_path*."""
     data_dir = tmp_path / "data"
     data_file = data_dir / "dualsolver.json"
     monkeypatch.setattr(storage, "_DATA_DIR", str(data_dir))
@@ -12,9 +16,7 @@ def _configure_tmp_db(monkeypatch, tmp_path: Path) -> Path:
     return data_file
 
 
-def test_settings_get_and_save(monkeypatch, tmp_path: Path) -> None:
-    _configure_tmp_db(monkeypatch, tmp_path)
-
+def test_settings_get_and_save(tmp_db: Path) -> None:
     settings = storage.get_settings()
     assert settings["theme"] in {"dark", "light"}
 
@@ -23,11 +25,11 @@ def test_settings_get_and_save(monkeypatch, tmp_path: Path) -> None:
     assert storage.get_settings()["animation_speed"] == "fast"
 
 
-def test_history_add_get_clear_and_limit(monkeypatch, tmp_path: Path) -> None:
-    _configure_tmp_db(monkeypatch, tmp_path)
-
-    for i in range(205):
-        storage.add_history(f"x + {i} = 0", f"x = {-i}")
+def test_history_add_get_clear_and_limit(tmp_db: Path) -> None:
+    with storage.batched_writes():
+        for i in range(205):
+            storage.add_history(f"x + {i} = 0", f"x = {-i}")
+        assert not tmp_db.exists()  # nothing written until the block exits
 
     history = storage.get_history()
     assert len(history) == 200
@@ -38,9 +40,29 @@ def test_history_add_get_clear_and_limit(monkeypatch, tmp_path: Path) -> None:
     assert storage.get_history() == []
 
 
-def test_history_pin_and_archive(monkeypatch, tmp_path: Path) -> None:
-    _configure_tmp_db(monkeypatch, tmp_path)
+def test_batched_writes_flushes_on_error_and_detaches_reads(tmp_db: Path) -> None:
+    with pytest.raises(RuntimeError):
+        with storage.batched_writes():
+            storage.add_history("x = 1", "x = 1")
+            storage.get_history()[0]["equation"] = "edited"
+            raise RuntimeError("boom")
+
+    assert storage._pending_db is None
+    assert tmp_db.exists()
+    history = storage.get_history()
+    assert len(history) == 1
+    assert history[0]["equation"] == "x = 1"
+
+
+def test_batched_save_settings_copies_the_dict(tmp_db: Path) -> None:
+    settings = {"theme": "light"}
+    with storage.batched_writes():
+        storage.save_settings(settings)
+        settings["theme"] = "dark"
+    assert storage.get_settings()["theme"] == "light"
+
 
+def test_history_pin_and_archive(tmp_db: Path) -> None:
     rid = storage.add_history("x = 1", "x = 1")
 
     # Pin
@@ -66,9 +88,7 @@ def test_history_pin_and_archive(monkeypatch, tmp_path: Path) -> None:
     assert len(storage.get_history()) == 1
 
 
-def test_delete_history_item(monkeypatch, tmp_path: Path) -> None:
-    _configure_tmp_db(monkeypatch, tmp_path)
-
+def test_delete_history_item(tmp_db: Path) -> None:
     rid1 = storage.add_history("x = 1", "x = 1")
     rid2 = storage.add_history("y = 2", "y = 2")
 
@@ -78,9 +98,7 @@ def test_delete_history_item(monkeypatch, tmp_path: Path) -> None:
     assert history[0]["id"] == rid2
 
 
-def test_clear_all_data(monkeypatch, tmp_path: Path) -> None:
-    _configure_tmp_db(monkeypatch, tmp_path)
-
+def test_clear_all_data(tmp_db: Path) -> None:
     storage.save_settings({"theme": "light", "animation_speed": "fast"})
     storage.add_history("x = 1", "x = 1")
     storage.clear_all_data()
@@ -89,33 +107,30 @@ def test_clear_all_data(monkeypatch, tmp_path: Path) -> None:
     assert storage.get_history() == []
 
 
-def test_load_db_handles_invalid_json(monkeypatch, tmp_path: Path) -> None:
-    data_file = _configure_tmp_db(monkeypatch, tmp_path)
-    data_file.parent.mkdir(parents=True, exist_ok=True)
-    data_file.write_text("{not-json", encoding="utf-8")
+def test_load_db_handles_invalid_json(tmp_db: Path) -> None:
+    tmp_db.parent.mkdir(parents=True, exist_ok=True)
+    tmp_db.write_text("{not-json", encoding="utf-8")
 
     db = storage._load_db()
     assert "settings" in db
     assert "history" in db
 
 
-def test_save_db_persists_content(monkeypatch, tmp_path: Path) -> None:
-    data_file = _configure_tmp_db(monkeypatch, tmp_path)
+def test_save_db_persists_content(tmp_db: Path) -> None:
     storage._save_db({"settings": {"theme": "dark"}, "history": []})
-    content = json.loads(data_file.read_text(encoding="utf-8"))
+    content = json.loads(tmp_db.read_text(encoding="utf-8"))
     assert content["settings"]["theme"] == "dark"
 
 
-def test_migrate_old_format(monkeypatch, tmp_path: Path) -> None:
+def test_migrate_old_format(tmp_db: Path) -> None:
     """Test that the old user-based format is migrated to the new flat format."""
-    data_file = _configure_tmp_db(monkeypatch, tmp_path)
-    data_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_db.parent.mkdir(parents=True, exist_ok=True)
     old_data = {
         "users": {"alice": {"settings": {"theme": "light"}, "history": []}},
         "guest_settings": {"theme": "dark", "animation_speed": "normal",
                            "show_verification": False, "show_graph": True},
     }
-    data_file.write_text(json.dumps(old_data), encoding="utf-8")
+    tmp_db.write_text(json.dumps(old_data), encoding="utf-8")
 
     db = storage._load_db()
     assert "history" in db